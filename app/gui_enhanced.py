@@ -2,7 +2,12 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 import pandas as pd
 from pathlib import Path
+import heapq
 import os
+import queue
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from PIL import Image, ImageTk
 
@@ -15,8 +20,12 @@ from utils.text_processor import TextProcessor
 from utils.model_trainer import ModelTrainer
 from utils.similarity_scorer import SimilarityScorer
 from utils.database_manager import DatabaseManager
+from utils.resume_cache import ResumeCache
 from app.theme import AppTheme, ModernUIComponents
 
+# Rows shown while a screening is still running; the full table is drawn once it finishes
+RESULTS_PREVIEW_SIZE = 200
+
 class ResumeScreenerApp:
     def __init__(self, root):
         self.root = root
@@ -28,10 +37,11 @@ class ResumeScreenerApp:
         self.theme.apply_theme(root)
         
         # Initialize components
-        self.data_loader = DataLoader()
+        self.similarity_scorer = SimilarityScorer()
+        self.resume_cache = ResumeCache(features_version=self.similarity_scorer.features_version)
+        self.data_loader = DataLoader(cache=self.resume_cache)
         self.text_processor = TextProcessor()
         self.model_trainer = ModelTrainer()
-        self.similarity_scorer = SimilarityScorer()
         self.db_manager = DatabaseManager()
         
         # Data storage
@@ -39,23 +49,75 @@ class ResumeScreenerApp:
         self.current_jd = ""
         self.ranked_candidates = []
         
-        # Load models
-        self.load_models()
+        # Background screening state
+        self.screening_thread = None
+        self.screening_cancel = threading.Event()
+        self.screening_queue = queue.Queue()
+        
+        # Background resume ingestion state
+        self.ingestion_thread = None
+        self.ingestion_queue = queue.Queue()
+        
+        # Set once the background model loading has finished, successfully or not
+        self.models_ready = threading.Event()
+        self.models_loaded = False
         
         # Setup enhanced GUI
         self.setup_enhanced_gui()
         
+        # Load models once the window is up
+        self.root.after(100, self.load_models)
+        
+        # Release database connections when the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+    def on_close(self):
+        """Stop background work, close the databases and destroy the window"""
+        self.cancel_screening()
+        self.db_manager.close()
+        self.resume_cache.close()
+        self.root.destroy()
+    
     def load_models(self):
-        """Load pre-trained models"""
+        """Load pre-trained models on a background thread"""
+        results_queue = queue.Queue()
+        threading.Thread(target=self._model_loading_worker, args=(results_queue,), daemon=True).start()
+        self.root.after(100, self._poll_model_loading, results_queue)
+    
+    def _model_loading_worker(self, results_queue):
+        """Unpickle the models and warm up NLTK off the Tk thread"""
         model_dir = "models"
+        loaded = False
         try:
             if os.path.exists(model_dir):
-                self.model_trainer.load_models(model_dir)
-                print("Models loaded successfully")
+                loaded = self.model_trainer.load_models(model_dir)
+                if loaded:
+                    print("Models loaded successfully")
             else:
                 print("Models directory not found. Please train models first.")
         except Exception as e:
             print(f"Error loading models: {e}")
+        
+        # Stopwords and WordNet would otherwise load during the first screening
+        try:
+            self.text_processor.preload()
+            self.similarity_scorer.text_processor.preload()
+        except Exception as e:
+            print(f"Error loading NLTK data: {e}")
+        
+        results_queue.put(loaded)
+    
+    def _poll_model_loading(self, results_queue: queue.Queue):
+        """Update the model indicator once background loading has finished"""
+        try:
+            loaded = results_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._poll_model_loading, results_queue)
+            return
+        
+        self.models_loaded = loaded
+        self.models_ready.set()
+        self.model_status_var.set("Models: ready" if loaded else "Models: not available")
     
     def setup_enhanced_gui(self):
         """Setup the enhanced GUI layout with modern styling"""
@@ -136,6 +198,9 @@ class ResumeScreenerApp:
                   style='Secondary.TButton').pack(side='left', padx=(0, 5))
         ttk.Button(resume_btn_frame, text="Multiple", 
                   command=self.load_multiple_word_resumes,
+                  style='Secondary.TButton').pack(side='left', padx=(0, 5))
+        ttk.Button(resume_btn_frame, text="Folder", 
+                  command=self.load_resume_folder,
                   style='Secondary.TButton').pack(side='left')
         
         # Resume list area
@@ -223,6 +288,10 @@ class ResumeScreenerApp:
                   command=self.screen_resumes,
                   style='Success.TButton').pack(side='left', padx=(0, 10))
         
+        ttk.Button(action_frame, text="Cancel", 
+                  command=self.cancel_screening,
+                  style='Warning.TButton').pack(side='left', padx=(0, 10))
+        
         ttk.Button(action_frame, text="Save to Database", 
                   command=self.save_to_database,
                   style='Primary.TButton').pack(side='left', padx=(0, 10))
@@ -256,6 +325,16 @@ class ResumeScreenerApp:
                                       length=100,
                                       mode='determinate')
         progress_bar.pack(side='right', padx=(0, 10))
+        
+        # Model readiness indicator
+        self.model_status_var = tk.StringVar()
+        self.model_status_var.set("Models: loading...")
+        
+        model_status_label = ttk.Label(status_frame,
+                                      textvariable=self.model_status_var,
+                                      style='Body.TLabel',
+                                      padding=5)
+        model_status_label.pack(side='right', padx=(0, 10))
     
     def load_jd_from_file(self):
         """Load job description from text file"""
@@ -302,8 +381,96 @@ class ResumeScreenerApp:
             filetypes=[("Word documents", "*.docx"), ("All files", "*.*")]
         )
         
-        for file_path in file_paths:
-            self._process_word_resume(file_path)
+        if file_paths:
+            self._start_ingestion(list(file_paths))
+    
+    def load_resume_folder(self):
+        """Load every Word resume in a folder"""
+        folder = filedialog.askdirectory(title="Select Folder of Resumes")
+        
+        if folder:
+            file_paths = sorted(str(path) for path in Path(folder).glob('*.docx')
+                                if not path.name.startswith('~$'))
+            if not file_paths:
+                messagebox.showinfo("Info", "No Word documents found in the selected folder")
+                return
+            self._start_ingestion(file_paths)
+    
+    def _start_ingestion(self, file_paths):
+        """Parse resumes on a background thread and add them to the list in batches"""
+        if self.ingestion_thread and self.ingestion_thread.is_alive():
+            messagebox.showinfo("Info", "Resumes are still loading")
+            return
+        
+        self.status_var.set(f"Loading {len(file_paths)} resumes...")
+        self.progress_var.set(0)
+        
+        self.ingestion_queue = queue.Queue()
+        self.ingestion_thread = threading.Thread(
+            target=self._ingestion_worker,
+            args=(file_paths, self.ingestion_queue),
+            daemon=True
+        )
+        self.ingestion_thread.start()
+        self.root.after(100, self._poll_ingestion_queue, self.ingestion_queue, len(file_paths), 0, [])
+    
+    def _ingestion_worker(self, file_paths, results_queue):
+        """Parse Word resumes in the loader's worker pool and stream them through the queue"""
+        try:
+            for file_path, resume_info in self.data_loader.iter_resume_infos(file_paths):
+                results_queue.put(('result', (file_path, resume_info)))
+            results_queue.put(('done', None))
+        except Exception as e:
+            results_queue.put(('error', e))
+    
+    def _poll_ingestion_queue(self, results_queue: queue.Queue, total: int, processed: int, skipped: list):
+        """Add parsed resumes to the list on the Tk thread, one batch per tick"""
+        # Clear All replaced the queue; drop this load
+        if results_queue is not self.ingestion_queue:
+            return
+        
+        batch = []
+        finished = None
+        try:
+            while len(batch) < 500:
+                kind, payload = results_queue.get_nowait()
+                if kind != 'result':
+                    finished = (kind, payload)
+                    break
+                file_path, resume_info = payload
+                processed += 1
+                if resume_info.get('text'):
+                    batch.append(resume_info)
+                else:
+                    skipped.append(Path(file_path).name)
+        except queue.Empty:
+            pass
+        
+        if batch:
+            self.resumes.extend(batch)
+            self.resume_listbox.insert(tk.END, *[
+                f"{info['name']} - {Path(info['file_path']).name}" for info in batch
+            ])
+            self.stats_label.config(text=f"{len(self.resumes)} resumes loaded")
+        
+        if finished is None:
+            self.progress_var.set(int(processed * 100 / total))
+            self.status_var.set(f"Loaded {processed} of {total} resumes...")
+            self.root.after(100, self._poll_ingestion_queue, results_queue, total, processed, skipped)
+            return
+        
+        kind, payload = finished
+        if kind == 'error':
+            messagebox.showerror("Error", f"Failed to load resumes: {payload}")
+            self.status_var.set("Error occurred")
+            self.progress_var.set(0)
+            return
+        
+        self.progress_var.set(100)
+        self.status_var.set(f"Loaded {processed - len(skipped)} of {total} resumes")
+        if skipped:
+            names = ', '.join(skipped[:10]) + (f" and {len(skipped) - 10} more" if len(skipped) > 10 else "")
+            messagebox.showwarning("Warning", f"No text could be extracted from {names}")
     
     def _process_word_resume(self, file_path: str):
         """Process a Word resume file"""
@@ -330,7 +497,11 @@ class ResumeScreenerApp:
             messagebox.showerror("Error", f"Failed to load resume: {e}")
     
     def screen_resumes(self):
-        """Screen and rank resumes"""
+        """Screen and rank resumes on a background thread"""
+        if self.screening_thread and self.screening_thread.is_alive():
+            messagebox.showinfo("Info", "Screening is already running")
+            return
+        
         # Get job description
         self.current_jd = self.jd_text.get(1.0, tk.END).strip()
         
@@ -342,57 +513,180 @@ class ResumeScreenerApp:
             messagebox.showwarning("Warning", "Please load some resumes first")
             return
         
-        # Show processing
+        # Candidates refer back to the loaded resumes by index instead of copying them
+        resumes_for_scoring = list(self.resumes)
+        
+        # Reset results and show processing
+        self.ranked_candidates = []
+        self.update_results_tree()
         self.status_var.set("Processing... Please wait")
-        self.progress_var.set(30)
-        self.root.update()
+        self.progress_var.set(0)
         
+        self.screening_cancel = threading.Event()
+        self.screening_queue = queue.Queue()
+        self.screening_thread = threading.Thread(
+            target=self._screening_worker,
+            args=(resumes_for_scoring, self.current_jd, self.screening_queue, self.screening_cancel),
+            daemon=True
+        )
+        self.screening_thread.start()
+        self.last_results_refresh = time.monotonic()
+        self.root.after(100, self._poll_screening_queue, self.screening_queue, len(resumes_for_scoring))
+    
+    def _screening_worker(self, resumes, job_description, results_queue, cancel_event):
+        """Score resumes off the Tk thread and stream each result through the queue"""
         try:
-            # Prepare resumes for scoring
-            resumes_for_scoring = []
-            for resume in self.resumes:
-                resumes_for_scoring.append({
-                    'id': resume.get('name', 'Unknown'),
-                    'text': resume.get('text', ''),
-                    'category': 'Unknown',
-                    'original_data': resume
-                })
+            # Compile the job description once for the whole run
+            job_profile = self.similarity_scorer.build_job_profile(job_description)
             
-            # Update progress
-            self.progress_var.set(60)
-            self.root.update()
+            # Spread large batches over all cores
+            workers = os.cpu_count() if len(resumes) >= 200 else None
             
-            # Rank candidates
-            self.ranked_candidates = self.similarity_scorer.rank_candidates(
-                resumes_for_scoring, self.current_jd
-            )
-            
-            # Update progress
-            self.progress_var.set(90)
-            self.root.update()
-            
-            # Update results tree
-            self.update_results_tree()
+            # Worker processes are forked, and a child forked while the model loader
+            # holds the NLTK lock would inherit it locked and hang in its initializer
+            if workers and not self._wait_for_models(cancel_event):
+                results_queue.put(('done', True))
+                return
             
-            # Complete progress
-            self.progress_var.set(100)
-            self.status_var.set(f"Ranked {len(self.ranked_candidates)} candidates")
+            candidates = []
+            new_features = []
+            scores = self.similarity_scorer.iter_scores(resumes, job_profile, workers)
+            try:
+                for i, similarity, skill_gaps, features in scores:
+                    if cancel_event.is_set():
+                        break
+                    self._remember_features(resumes[i], features, new_features)
+                    candidate = self.similarity_scorer.make_candidate(i, resumes[i], similarity, skill_gaps, features)
+                    candidates.append(candidate)
+                    results_queue.put(('result', candidate))
+            finally:
+                scores.close()
+                if new_features:
+                    self.resume_cache.update_features_many(new_features)
             
+            self._classify_candidates(candidates, resumes, results_queue, cancel_event)
+            results_queue.put(('done', cancel_event.is_set()))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to screen resumes: {e}")
+            results_queue.put(('error', e))
+    
+    def _wait_for_models(self, cancel_event) -> bool:
+        """Block until background model and NLTK loading is over; False if cancelled first"""
+        while not self.models_ready.wait(0.1):
+            if cancel_event.is_set():
+                return False
+        return True
+    
+    def _classify_candidates(self, candidates, resumes, results_queue, cancel_event, batch_size=500):
+        """Predict categories in batches once the models have finished loading"""
+        if not self._wait_for_models(cancel_event) or not self.models_loaded:
+            return
+        
+        for start in range(0, len(candidates), batch_size):
+            if cancel_event.is_set():
+                return
+            batch = candidates[start:start + batch_size]
+            predictions = self.model_trainer.predict_categories([resumes[c.index]['text'] for c in batch])
+            results_queue.put(('categories', list(zip(batch, predictions))))
+    
+    def _remember_features(self, resume, features, new_features, batch_size=256):
+        """Keep newly computed resume features so re-screening only redoes the JD side"""
+        if resume.get('features') is not None:
+            return
+        
+        resume['features'] = features
+        if resume.get('content_hash'):
+            # Written to the cache a batch at a time, in one transaction each
+            new_features.append((resume['content_hash'], features))
+            if len(new_features) >= batch_size:
+                self.resume_cache.update_features_many(new_features)
+                new_features.clear()
+    
+    def _poll_screening_queue(self, results_queue: queue.Queue, total: int):
+        """Drain screening results on the Tk thread and refresh progress"""
+        # A newer run or Clear All replaced the queue; drop this one
+        if results_queue is not self.screening_queue:
+            return
+        
+        finished = None
+        received = False
+        classified = False
+        try:
+            while True:
+                kind, payload = results_queue.get_nowait()
+                if kind == 'result':
+                    self.ranked_candidates.append(payload)
+                    received = True
+                elif kind == 'categories':
+                    # Set on the Tk thread so the tree never sees a half-classified candidate
+                    for candidate, (category, confidence) in payload:
+                        candidate.category = category
+                        candidate.category_confidence = confidence
+                    self._update_tree_categories(payload)
+                    classified = True
+                else:
+                    finished = (kind, payload)
+                    break
+        except queue.Empty:
+            pass
+        
+        scored = len(self.ranked_candidates)
+        
+        if finished is None:
+            if received:
+                # Show the best results so far, at most once a second
+                if time.monotonic() - self.last_results_refresh >= 1.0:
+                    self.update_results_tree(self._preview_candidates())
+                    self.last_results_refresh = time.monotonic()
+                self.progress_var.set(int(scored * 100 / total))
+                self.status_var.set(f"Scored {scored} of {total} resumes...")
+            elif classified:
+                self.status_var.set(f"Predicting categories for {scored} candidates...")
+            self.root.after(100, self._poll_screening_queue, results_queue, total)
+            return
+        
+        kind, payload = finished
+        self.similarity_scorer.assign_ranks(self.ranked_candidates)
+        self.update_results_tree()
+        
+        if kind == 'error':
+            messagebox.showerror("Error", f"Failed to screen resumes: {payload}")
             self.status_var.set("Error occurred")
             self.progress_var.set(0)
+        elif payload:
+            self.status_var.set(f"Cancelled - ranked {scored} of {total} candidates")
+        else:
+            self.progress_var.set(100)
+            self.status_var.set(f"Ranked {scored} candidates")
+    
+    def cancel_screening(self):
+        """Stop a running screening after the resumes already in progress"""
+        if self.screening_thread and self.screening_thread.is_alive():
+            self.screening_cancel.set()
+            self.status_var.set("Cancelling...")
+    
+    def _preview_candidates(self):
+        """Best candidates scored so far, numbered provisionally, without sorting every result"""
+        preview = heapq.nsmallest(RESULTS_PREVIEW_SIZE, self.ranked_candidates,
+                                  key=lambda c: (-c.similarity_score, c.index))
+        for i, candidate in enumerate(preview):
+            candidate.rank = i + 1
+        return preview
+    
+    def _update_tree_categories(self, predictions):
+        """Fill in predicted categories on rows already in the table"""
+        for candidate, (category, _) in predictions:
+            item = str(candidate.index)
+            if self.results_tree.exists(item):
+                self.results_tree.set(item, 'Category', category)
     
-    def update_results_tree(self):
-        """Update the results treeview with ranked candidates"""
-        # Clear existing items
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        # Add ranked candidates with color coding
-        for candidate in self.ranked_candidates:
-            missing_skills = sum(len(skills) for skills in candidate['skill_gaps'].values())
-            score = candidate['similarity_score']
+    def update_results_tree(self, candidates=None):
+        """Update the results treeview with ranked candidates, or only the given ones"""
+        # Clear existing items in one call
+        self.results_tree.delete(*self.results_tree.get_children())
+        
+        # Add ranked candidates with color coding; rows are keyed by resume index
+        for candidate in self.ranked_candidates if candidates is None else candidates:
+            score = candidate.similarity_score
             
             # Determine tag based on score
             if score >= 0.8:
@@ -404,12 +698,12 @@ class ResumeScreenerApp:
             else:
                 tag = 'poor'
             
-            self.results_tree.insert('', tk.END, values=(
-                candidate['rank'],
-                candidate['id'],
-                candidate['category'],
+            self.results_tree.insert('', tk.END, iid=str(candidate.index), values=(
+                candidate.rank,
+                candidate.id,
+                candidate.category,
                 f"{score:.1%}",
-                f"{missing_skills} missing"
+                f"{candidate.missing_skills_count} missing"
             ), tags=(tag,))
         
         # Configure tag colors
@@ -420,36 +714,40 @@ class ResumeScreenerApp:
     
     def save_to_database(self):
         """Save ranked candidates to database"""
+        # Mid-screening results are partial and only provisionally ranked
+        if self.screening_thread and self.screening_thread.is_alive():
+            messagebox.showinfo("Info", "Screening is still running. Save once it finishes or is cancelled.")
+            return
+        
         if not self.ranked_candidates:
             messagebox.showwarning("Warning", "No ranked candidates to save. Please screen resumes first.")
             return
         
         try:
-            saved_count = 0
+            applicants = []
             for candidate in self.ranked_candidates:
                 # Get original resume data
-                original_data = candidate['original_data']
+                original_data = self.resumes[candidate.index]
                 
-                # Prepare applicant data
-                applicant_data = {
-                    'name': original_data.get('name', candidate['id']),
+                # Prepare applicant data, reusing the skills extracted during ranking
+                applicants.append({
+                    'name': original_data.get('name', candidate.id),
                     'email': original_data.get('email', ''),
                     'phone': original_data.get('phone', ''),
                     'resume_text': original_data.get('text', ''),
                     'file_path': original_data.get('file_path', ''),
-                    'category': candidate['category'],
-                    'score': candidate['similarity_score'],
+                    'category': candidate.category,
+                    'score': candidate.similarity_score,
                     'missing_skills': ', '.join([
                         f"{cat}: {', '.join(skills)}" 
-                        for cat, skills in candidate['skill_gaps'].items()
+                        for cat, skills in candidate.skill_gaps.items()
                     ]),
                     'processed_date': datetime.now(),
-                    'skills': self.text_processor.extract_skills(original_data.get('text', ''))
-                }
-                
-                # Save to database
-                self.db_manager.add_applicant(applicant_data)
-                saved_count += 1
+                    'skills': candidate.skills
+                })
+            
+            # Save to database in one transaction
+            saved_count = len(self.db_manager.add_applicants_bulk(applicants))
             
             self.status_var.set(f"Saved {saved_count} candidates to database")
             messagebox.showinfo("Success", f"Successfully saved {saved_count} candidates to database")
@@ -469,11 +767,9 @@ class ResumeScreenerApp:
             messagebox.showinfo("Info", "Please select a candidate from the results")
             return
         
-        item = self.results_tree.item(selection[0])
-        rank = item['values'][0]
-        
-        # Find the candidate
-        candidate = next((c for c in self.ranked_candidates if c['rank'] == rank), None)
+        # Rows are keyed by the candidate's resume index
+        index = int(selection[0])
+        candidate = next((c for c in self.ranked_candidates if c.index == index), None)
         
         if candidate:
             self.show_enhanced_candidate_details(candidate)
@@ -481,7 +777,7 @@ class ResumeScreenerApp:
     def show_enhanced_candidate_details(self, candidate):
         """Show enhanced candidate information"""
         details_window = tk.Toplevel(self.root)
-        details_window.title(f"Candidate Analysis: {candidate['id']}")
+        details_window.title(f"Candidate Analysis: {candidate.id}")
         details_window.geometry("900x700")
         
         # Apply theme to window
@@ -491,7 +787,7 @@ class ResumeScreenerApp:
         header_frame = ModernUIComponents.create_header(
             details_window,
             f"Candidate Analysis",
-            f"{candidate['id']} - Score: {candidate['similarity_score']:.1%}"
+            f"{candidate.id} - Score: {candidate.similarity_score:.1%}"
         )
         header_frame.pack(fill='x', padx=20, pady=(15, 10))
         
@@ -515,9 +811,9 @@ class ResumeScreenerApp:
                  style='Subheading.TLabel').pack(pady=(15, 5))
         
         score_font = ('Segoe UI', 36, 'bold')
-        score_color = self.theme.colors['success'] if candidate['similarity_score'] >= 0.7 else self.theme.colors['warning'] if candidate['similarity_score'] >= 0.5 else self.theme.colors['accent']
+        score_color = self.theme.colors['success'] if candidate.similarity_score >= 0.7 else self.theme.colors['warning'] if candidate.similarity_score >= 0.5 else self.theme.colors['accent']
         score_label = tk.Label(overall_card, 
-                              text=f"{candidate['similarity_score']:.1%}",
+                              text=f"{candidate.similarity_score:.1%}",
                               font=score_font,
                               fg=score_color,
                               bg=self.theme.colors['card_bg'])
@@ -530,8 +826,12 @@ class ResumeScreenerApp:
         ttk.Label(category_card, text="Predicted Category",
                  style='Subheading.TLabel').pack(pady=(15, 5))
         
+        category_text = candidate.category
+        if candidate.category_confidence is not None:
+            category_text += f" ({candidate.category_confidence:.0%})"
+        
         category_label = tk.Label(category_card,
-                                 text=candidate['category'],
+                                 text=category_text,
                                  font=('Segoe UI', 18, 'bold'),
                                  fg=self.theme.colors['text_primary'],
                                  bg=self.theme.colors['card_bg'])
@@ -545,7 +845,7 @@ class ResumeScreenerApp:
                  style='Subheading.TLabel').pack(pady=(15, 5))
         
         missing_label = tk.Label(missing_card,
-                                text=str(candidate['missing_skills_count']),
+                                text=str(candidate.missing_skills_count),
                                 font=('Segoe UI', 24, 'bold'),
                                 fg=self.theme.colors['accent'],
                                 bg=self.theme.colors['card_bg'])
@@ -556,7 +856,7 @@ class ResumeScreenerApp:
         notebook.add(skills_frame, text="Skills Analysis")
         
         # Extract skills from resume
-        resume_skills = self.text_processor.extract_skills(candidate['original_data']['text'])
+        resume_skills = candidate.skills or self.text_processor.extract_skills(self.resumes[candidate.index]['text'])
         
         # Create skill visualization
         skills_container = ttk.Frame(skills_frame)
@@ -596,7 +896,7 @@ class ResumeScreenerApp:
                     row += 1
         
         # Missing skills section
-        if candidate['skill_gaps']:
+        if candidate.skill_gaps:
             missing_frame = ttk.Frame(skills_container)
             missing_frame.pack(fill='both', expand=True)
             
@@ -609,7 +909,7 @@ class ResumeScreenerApp:
             col = 0
             row = 0
             
-            for category, skills in candidate['skill_gaps'].items():
+            for category, skills in candidate.skill_gaps.items():
                 category_frame = self.theme.create_card(missing_grid)
                 category_frame.grid(row=row, column=col, padx=5, pady=5, sticky='nsew')
                 
@@ -631,11 +931,15 @@ class ResumeScreenerApp:
         # Configure grid weights
         for i in range(max_cols):
             skills_grid.columnconfigure(i, weight=1)
-            if candidate['skill_gaps']:
+            if candidate.skill_gaps:
                 missing_grid.columnconfigure(i, weight=1)
     
     def clear_all(self):
         """Clear all data"""
+        self.cancel_screening()
+        self.screening_queue = queue.Queue()
+        self.ingestion_queue = queue.Queue()
+        
         self.resumes = []
         self.ranked_candidates = []
         self.current_jd = ""
@@ -644,8 +948,7 @@ class ResumeScreenerApp:
         self.jd_text.delete(1.0, tk.END)
         
         # Clear results tree
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_tree.delete(*self.results_tree.get_children())
         
         # Update stats
         self.stats_label.config(text="0 resumes loaded")
@@ -665,8 +968,29 @@ class EnhancedDatabaseViewer:
         self.theme = AppTheme()
         self.theme.apply_theme(self.window)
         
+        # Only a sliding window of rows is kept in the tree; more are fetched while scrolling
+        self.page_size = 100
+        self.max_loaded_rows = 500
+        self.query = {'order_by_score': False, 'keyword': '', 'min_score': 0.0}
+        self.row_keys = {}
+        self.more_above = False
+        self.more_below = False
+        self.loading_page = False
+        
+        # Searches run on a worker thread; only the newest request's results are shown
+        self.search_after_id = None
+        self.search_generation = 0
+        self.running_search = None
+        self.last_search = None
+        self.search_requests = queue.Queue()
+        self.search_results = queue.Queue()
+        self.search_thread = threading.Thread(target=self.search_worker, daemon=True)
+        self.search_thread.start()
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         self.setup_enhanced_gui()
         self.load_data()
+        self.window.after(50, self.poll_search_results)
     
     def setup_enhanced_gui(self):
         """Setup enhanced database viewer GUI"""
@@ -760,11 +1084,12 @@ class EnhancedDatabaseViewer:
         
         # Create treeview
         columns = ('ID', 'Name', 'Email', 'Category', 'Score', 'Missing Skills', 'Processed Date')
+        self.v_scrollbar = v_scrollbar
         self.tree = ttk.Treeview(tree_frame, 
                                 columns=columns, 
                                 show='headings',
                                 xscrollcommand=h_scrollbar.set,
-                                yscrollcommand=v_scrollbar.set,
+                                yscrollcommand=self.on_tree_scrolled,
                                 height=15)
         
         self.tree.grid(row=0, column=0, sticky='nsew')
@@ -790,6 +1115,12 @@ class EnhancedDatabaseViewer:
         self.tree.column('Missing Skills', width=150, anchor='center')
         self.tree.column('Processed Date', width=150, anchor='center')
         
+        # Configure tag colors
+        self.tree.tag_configure('excellent', background='#D5F4E6')
+        self.tree.tag_configure('good', background='#D6EAF8')
+        self.tree.tag_configure('average', background='#FCF3CF')
+        self.tree.tag_configure('poor', background='#FADBD8')
+        
         # Configure tree frame grid
         tree_frame.columnconfigure(0, weight=1)
         tree_frame.rowconfigure(0, weight=1)
@@ -806,52 +1137,115 @@ class EnhancedDatabaseViewer:
     
     def load_data(self, order_by_score: bool = False):
         """Load data from database"""
+        # Results of a search still in flight must not replace this listing
+        self.search_generation += 1
+        self.last_search = None
+        self.query = {'order_by_score': order_by_score, 'keyword': '', 'min_score': 0.0}
         try:
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            total = self.reload_rows()
+            if total == 0:
+                self.status_var.set("No data in database")
+            else:
+                self.status_var.set(f"Loaded {total} applicants from database")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load data: {e}")
+    
+    def reload_rows(self) -> int:
+        """Show the first page for the current query and return the total number of matches"""
+        self.show_first_page(self.db_manager.get_applicants_page(self.page_size, **self.query))
+        return self.db_manager.count_applicants(self.query['keyword'], self.query['min_score'])
+    
+    def show_first_page(self, rows):
+        """Replace the tree contents with the first page of a query"""
+        self.tree.delete(*self.tree.get_children())
+        self.row_keys = {}
+        self.more_above = False
+        self.more_below = len(rows) == self.page_size
+        self.insert_rows(rows, tk.END)
+        self.tree.yview_moveto(0)
+    
+    def insert_rows(self, rows, position):
+        """Insert applicant rows at the top ('0') or bottom (tk.END) of the tree"""
+        if position != tk.END:
+            rows = reversed(rows)
+        
+        for row in rows:
+            score = row['score']
             
-            # Get data from database
-            df = self.db_manager.get_all_applicants(order_by_score)
+            # Determine tag based on score
+            if score >= 0.8:
+                tag = 'excellent'
+            elif score >= 0.6:
+                tag = 'good'
+            elif score >= 0.4:
+                tag = 'average'
+            else:
+                tag = 'poor'
             
-            if df.empty:
-                self.status_var.set("No data in database")
+            item = self.tree.insert('', position, values=(
+                int(row['id']),
+                row['name'],
+                row['email'],
+                row['category'],
+                f"{row['score']:.1%}",
+                f"{len(row['missing_skills'].split(',')) if row['missing_skills'] else 0} skills",
+                row['processed_date']
+            ), tags=(tag,))
+            self.row_keys[item] = self.db_manager.page_key(row, self.query['order_by_score'])
+    
+    def on_tree_scrolled(self, first, last):
+        """Keep the scrollbar in sync and fetch more rows near either end of the window"""
+        self.v_scrollbar.set(first, last)
+        
+        if self.loading_page:
+            return
+        if float(last) > 0.9 and self.more_below:
+            self.loading_page = True
+            self.window.after_idle(self.load_adjacent_page, True)
+        elif float(first) < 0.1 and self.more_above:
+            self.loading_page = True
+            self.window.after_idle(self.load_adjacent_page, False)
+    
+    def load_adjacent_page(self, below: bool):
+        """Fetch the page after the last row or before the first row and trim the far end"""
+        try:
+            items = self.tree.get_children()
+            if not items:
                 return
             
-            # Add data to treeview with color coding
-            for _, row in df.iterrows():
-                score = row['score']
-                
-                # Determine tag based on score
-                if score >= 0.8:
-                    tag = 'excellent'
-                elif score >= 0.6:
-                    tag = 'good'
-                elif score >= 0.4:
-                    tag = 'average'
-                else:
-                    tag = 'poor'
-                
-                self.tree.insert('', tk.END, values=(
-                    int(row['id']),
-                    row['name'],
-                    row['email'],
-                    row['category'],
-                    f"{row['score']:.1%}",
-                    f"{len(row['missing_skills'].split(',')) if row['missing_skills'] else 0} skills",
-                    row['processed_date']
-                ), tags=(tag,))
+            # Keep the row the user is looking at in view while rows come and go
+            anchor = self.tree.identify_row(self.tree.winfo_height() // 2) or items[0]
             
-            # Configure tag colors
-            self.tree.tag_configure('excellent', background='#D5F4E6')
-            self.tree.tag_configure('good', background='#D6EAF8')
-            self.tree.tag_configure('average', background='#FCF3CF')
-            self.tree.tag_configure('poor', background='#FADBD8')
+            if below:
+                rows = self.db_manager.get_applicants_page(
+                    self.page_size, after=self.row_keys[items[-1]], **self.query)
+                self.more_below = len(rows) == self.page_size
+                self.insert_rows(rows, tk.END)
+            else:
+                rows = self.db_manager.get_applicants_page(
+                    self.page_size, before=self.row_keys[items[0]], **self.query)
+                self.more_above = len(rows) == self.page_size
+                self.insert_rows(rows, '0')
             
-            self.status_var.set(f"Loaded {len(df)} applicants from database")
+            # Drop rows from the opposite end to keep memory bounded
+            items = self.tree.get_children()
+            excess = len(items) - self.max_loaded_rows
+            if excess > 0:
+                dropped = items[:excess] if below else items[-excess:]
+                for item in dropped:
+                    self.row_keys.pop(item, None)
+                self.tree.delete(*dropped)
+                if below:
+                    self.more_above = True
+                else:
+                    self.more_below = True
             
+            if self.tree.exists(anchor):
+                self.tree.see(anchor)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {e}")
+        finally:
+            self.loading_page = False
     
     def order_by_score(self):
         """Order applicants by score"""
@@ -859,54 +1253,120 @@ class EnhancedDatabaseViewer:
         self.status_var.set("Ordered by score (highest first)")
     
     def on_search_changed(self, *args):
-        """Handle search text change"""
+        """Handle search text change, waiting for a pause in typing before searching"""
+        if self.search_after_id is not None:
+            self.window.after_cancel(self.search_after_id)
+        self.search_after_id = self.window.after(250, self.start_search)
+    
+    def start_search(self):
+        """Send the current search to the worker, cancelling any query still running"""
+        self.search_after_id = None
         keyword = self.search_var.get()
-        min_score = self.min_score_var.get()
+        try:
+            min_score = self.min_score_var.get()
+        except tk.TclError:
+            min_score = 0.0
+        
+        if not keyword and min_score <= 0:
+            self.load_data()
+            return
         
-        if keyword or min_score > 0:
-            self.perform_search(keyword, min_score)
+        self.perform_search(keyword, min_score)
     
     def perform_search(self, keyword: str, min_score: float):
-        """Perform search in database"""
-        try:
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
-            # Search in database
-            df = self.db_manager.search_applicants(keyword, min_score)
-            
-            if df.empty:
-                self.status_var.set("No matching applicants found")
+        """Perform search in database on the search worker"""
+        # A keyword that extends the previous one can only match a subset of its
+        # results, as long as both are searched the same way (FTS or substring)
+        within_ids = None
+        previous = self.last_search
+        mode = self.db_manager.search_mode(keyword)
+        if (previous and previous['ids'] is not None and previous['keyword']
+                and keyword.startswith(previous['keyword']) and min_score >= previous['min_score']
+                and mode == previous['mode']):
+            within_ids = previous['ids']
+        
+        self.search_generation += 1
+        query = {'order_by_score': True, 'keyword': keyword, 'min_score': min_score,
+                 'within_ids': within_ids}
+        
+        # Abort an older query that is still running
+        running = self.running_search
+        if running is not None and running < self.search_generation:
+            self.db_manager.interrupt(self.search_thread.ident)
+        
+        self.search_requests.put((self.search_generation, query))
+        self.status_var.set("Searching...")
+    
+    def search_worker(self):
+        """Run search requests on a background thread, always skipping to the newest one"""
+        while True:
+            request = self.search_requests.get()
+            while request is not None:
+                try:
+                    request = self.search_requests.get_nowait()
+                except queue.Empty:
+                    break
+            if request is None:
+                self.db_manager.release_connection()
                 return
             
-            # Add data to treeview
-            for _, row in df.iterrows():
-                score = row['score']
+            generation, query = request
+            self.running_search = generation
+            try:
+                rows = self.db_manager.get_applicants_page(self.page_size, **query)
+                total = self.db_manager.count_applicants(
+                    query['keyword'], query['min_score'], query['within_ids'])
+                ids = self.db_manager.get_matching_ids(
+                    query['keyword'], query['min_score'], query['within_ids'])
+                self.search_results.put(('result', generation, (query, rows, total, ids)))
+            except sqlite3.OperationalError as e:
+                # An interrupt meant for an older query can hit this one; run it again
+                if 'interrupt' in str(e) and generation == self.search_generation:
+                    self.search_requests.put(request)
+                elif 'interrupt' not in str(e):
+                    self.search_results.put(('error', generation, e))
+            except Exception as e:
+                self.search_results.put(('error', generation, e))
+            finally:
+                self.running_search = None
+    
+    def poll_search_results(self):
+        """Show the newest search results on the Tk thread"""
+        if not self.window.winfo_exists():
+            return
+        
+        try:
+            while True:
+                kind, generation, payload = self.search_results.get_nowait()
+                if generation != self.search_generation:
+                    continue
                 
-                if score >= 0.8:
-                    tag = 'excellent'
-                elif score >= 0.6:
-                    tag = 'good'
-                elif score >= 0.4:
-                    tag = 'average'
-                else:
-                    tag = 'poor'
+                if kind == 'error':
+                    messagebox.showerror("Error", f"Search failed: {payload}")
+                    continue
                 
-                self.tree.insert('', tk.END, values=(
-                    int(row['id']),
-                    row['name'],
-                    row['email'],
-                    row['category'],
-                    f"{row['score']:.1%}",
-                    f"{len(row['missing_skills'].split(',')) if row['missing_skills'] else 0} skills",
-                    row['processed_date']
-                ), tags=(tag,))
-            
-            self.status_var.set(f"Found {len(df)} matching applicants")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Search failed: {e}")
+                query, rows, total, ids = payload
+                self.query = query
+                self.last_search = {'keyword': query['keyword'], 'min_score': query['min_score'], 'ids': ids,
+                                    'mode': self.db_manager.search_mode(query['keyword'])}
+                self.show_first_page(rows)
+                
+                if total == 0:
+                    self.status_var.set("No matching applicants found")
+                else:
+                    self.status_var.set(f"Found {total} matching applicants")
+        except queue.Empty:
+            pass
+        
+        self.window.after(50, self.poll_search_results)
+    
+    def on_close(self):
+        """Stop the search worker and close the window"""
+        self.search_generation += 1
+        if self.running_search is not None:
+            self.db_manager.interrupt(self.search_thread.ident)
+        self.search_requests.put(None)
+        self.window.destroy()
     
     def export_to_csv(self):
         """Export database to CSV"""
@@ -0,0 +1,68 @@
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import nltk
+from nltk.tokenize import word_tokenize
+from utils import text_processor
+from utils.text_processor import TextProcessor
+
+def load_corpus(csv_path: str, limit: int):
+    """Load resume texts from Resume.csv, or generate a synthetic corpus if it is missing"""
+    if os.path.exists(csv_path):
+        from utils.data_loader import DataLoader
+        texts, _ = DataLoader(csv_path).prepare_training_data()
+        return texts[:limit]
+    
+    print(f"{csv_path} not found, using a synthetic corpus")
+    random.seed(0)
+    words = ("python java sql machine learning managed team customers sales finance budget "
+             "developed implemented analysis reporting communication leadership projects "
+             "engineer manager senior responsible cannot gonna the and of to in for with").split()
+    return [' '.join(random.choice(words) for _ in range(600)) for _ in range(limit)]
+
+def baseline_keyword_counts(processor: TextProcessor, text: str, top_n: int = 50):
+    """The previous tokenize path: word_tokenize plus an uncached WordNet lemmatizer"""
+    tokens = [
+        processor.lemmatizer.lemmatize(token)
+        for token in word_tokenize(text)
+        if token not in processor.stop_words and len(token) > 2
+    ]
+    return nltk.FreqDist(tokens).most_common(top_n)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TextProcessor.tokenize_text")
+    parser.add_argument('--csv', default='data/Resume.csv', help="Resume.csv to take texts from")
+    parser.add_argument('--limit', type=int, default=2000, help="Number of resumes to process")
+    args = parser.parse_args()
+    
+    processor = TextProcessor()
+    cleaned = processor.preprocess_batch(load_corpus(args.csv, args.limit))
+    print(f"Corpus: {len(cleaned)} resumes, {sum(map(len, cleaned)) / 1e6:.1f} MB cleaned text")
+    
+    start = time.perf_counter()
+    expected = [baseline_keyword_counts(processor, text) for text in cleaned]
+    baseline_time = time.perf_counter() - start
+    
+    text_processor.lemmatize.cache_clear()
+    start = time.perf_counter()
+    actual = [processor.extract_keyword_counts(text, 50) for text in cleaned]
+    fast_time = time.perf_counter() - start
+    
+    if actual != expected:
+        print("ERROR: keyword output differs from the word_tokenize path")
+        sys.exit(1)
+    
+    print(f"word_tokenize + lemmatizer: {baseline_time:.2f}s")
+    print(f"fast path + lemma cache:    {fast_time:.2f}s ({baseline_time / fast_time:.1f}x faster)")
+    print(f"Lemma cache: {text_processor.lemmatize.cache_info()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from utils.data_loader import DataLoader
+from utils.similarity_scorer import SimilarityScorer
+
+# Rank leads the fields only with --top-k; streamed results are written unranked
+OUTPUT_FIELDS = ['file_path', 'name', 'email', 'phone', 'score',
+                 'missing_skills_count', 'missing_skills', 'skills']
+RANKED_FIELDS = ['rank'] + OUTPUT_FIELDS
+
+def find_resumes(inputs):
+    """Expand directories, glob patterns and file names into a sorted list of .docx paths"""
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = glob.glob(os.path.join(item, '*.docx'))
+        else:
+            matches = glob.glob(item, recursive=True) or [item]
+
+        for path in matches:
+            name = os.path.basename(path)
+            if name.lower().endswith('.docx') and not name.startswith('~$'):
+                paths.add(path)
+    return sorted(paths)
+
+def read_job_description(path: str, data_loader: DataLoader) -> str:
+    """Read a job description from a .docx or plain text file"""
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No such file: {path}")
+    if path.lower().endswith('.docx'):
+        return data_loader.extract_text_from_docx(path)
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read()
+
+def iter_resumes(paths, data_loader: DataLoader, workers: int, details: dict, cache=None):
+    """Yield resumes for scoring while keeping only their contact details, not their text"""
+    index = 0
+    for path, resume_info in data_loader.iter_resume_infos(paths, workers=workers):
+        if not resume_info.get('text'):
+            print(f"Skipping {path}: no text could be extracted", file=sys.stderr)
+            continue
+
+        details[index] = {
+            'file_path': path,
+            'name': resume_info.get('name', ''),
+            'email': resume_info.get('email', ''),
+            'phone': resume_info.get('phone', ''),
+            'content_hash': resume_info.get('content_hash') if cache else None,
+            'cached_features': resume_info.get('features') is not None
+        }
+        index += 1
+        yield {
+            'id': resume_info.get('name', ''),
+            'text': resume_info['text'],
+            'features': resume_info.get('features')
+        }
+
+def format_row(details: dict, candidate, output_format: str, ranked: bool = False) -> dict:
+    """Build one output record for a scored resume, led by its rank when the results are ranked"""
+    row = {'rank': candidate.rank} if ranked else {}
+    row.update({
+        'file_path': details['file_path'],
+        'name': details['name'],
+        'email': details['email'],
+        'phone': details['phone'],
+        'score': round(candidate.similarity_score, 4),
+        'missing_skills_count': candidate.missing_skills_count,
+        'missing_skills': candidate.skill_gaps,
+        'skills': candidate.skills
+    })
+
+    # CSV cells hold the same text the database stores
+    if output_format == 'csv':
+        row['missing_skills'] = ', '.join(
+            f"{category}: {', '.join(skills)}" for category, skills in candidate.skill_gaps.items()
+        )
+        row['skills'] = ', '.join(
+            f"{category}: {', '.join(skills)}" for category, skills in candidate.skills.items()
+        )
+    return row
+
+def remember_features(scored, details: dict, cache, batch_size: int = 256):
+    """Store newly computed features in the cache so later screenings only redo the JD side"""
+    new_features = []
+    try:
+        for result in scored:
+            i, features = result[0], result[3]
+            if cache and details[i]['content_hash'] and not details[i]['cached_features']:
+                new_features.append((details[i]['content_hash'], features))
+                if len(new_features) >= batch_size:
+                    cache.update_features_many(new_features)
+                    new_features = []
+            yield result
+    finally:
+        if new_features:
+            cache.update_features_many(new_features)
+
+def split_workers(args):
+    """Share the --workers budget between parsing and scoring, which run at the same time"""
+    parse_workers = args.parse_workers or max(1, args.workers // 2)
+    score_workers = args.score_workers or max(1, args.workers - parse_workers)
+    return parse_workers, score_workers
+
+class ResultWriter:
+    """Write result rows as JSON lines or CSV, flushing as they arrive"""
+    def __init__(self, file, output_format: str, fieldnames=OUTPUT_FIELDS):
+        self.file = file
+        self.output_format = output_format
+        self.csv_writer = None
+        if output_format == 'csv':
+            self.csv_writer = csv.DictWriter(file, fieldnames=fieldnames)
+            self.csv_writer.writeheader()
+
+    def write(self, row: dict):
+        if self.csv_writer:
+            self.csv_writer.writerow(row)
+        else:
+            self.file.write(json.dumps(row) + '\n')
+        self.file.flush()
+
+def screen(args) -> int:
+    """Score every resume against the job description and stream the results"""
+    scorer = SimilarityScorer()
+    cache = None
+    if args.cache:
+        from utils.resume_cache import ResumeCache
+        cache = ResumeCache(args.cache, features_version=scorer.features_version)
+
+    data_loader = DataLoader(cache=cache)
+
+    try:
+        job_description = read_job_description(args.job_description, data_loader)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error: cannot read job description {args.job_description}: {e}", file=sys.stderr)
+        return 1
+    if not job_description.strip():
+        print(f"Error: no text found in job description {args.job_description}", file=sys.stderr)
+        return 1
+
+    paths = find_resumes(args.resumes)
+    if not paths:
+        print("Error: no .docx resumes found", file=sys.stderr)
+        return 1
+    parse_workers, score_workers = split_workers(args)
+    print(f"Screening {len(paths)} resumes with {parse_workers} parsing and {score_workers} scoring workers",
+          file=sys.stderr)
+
+    output_format = args.format or ('csv' if args.output.lower().endswith('.csv') else 'jsonl')
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+
+    try:
+        writer = ResultWriter(output, output_format, RANKED_FIELDS if args.top_k else OUTPUT_FIELDS)
+        job_profile = scorer.build_job_profile(job_description)
+        details = {}
+        resumes = iter_resumes(paths, data_loader, parse_workers, details, cache)
+        scored = scorer.iter_scores(resumes, job_profile, score_workers,
+                                    skill_gaps=not args.top_k)
+
+        count = 0
+        if args.top_k:
+            # Only the best K are kept; everything else is dropped as it is scored
+            selected = scorer.select_top(remember_features(scored, details, cache), args.top_k)
+            for candidate in scorer.make_finalists(selected, details, job_profile):
+                writer.write(format_row(details[candidate.index], candidate, output_format, ranked=True))
+                count += 1
+        else:
+            # Results go out in completion order, unranked, as soon as they exist
+            for i, similarity, skill_gaps, features in remember_features(scored, details, cache):
+                candidate = scorer.make_candidate(i, details[i], similarity, skill_gaps, features)
+                writer.write(format_row(details.pop(i), candidate, output_format))
+                count += 1
+
+        print(f"Wrote {count} results to {args.output}", file=sys.stderr)
+        return 0
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if cache:
+            cache.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Screen Word resumes against a job description without the GUI")
+    parser.add_argument('job_description', help="Job description file (.txt or .docx)")
+    parser.add_argument('resumes', nargs='+', help="Directories, glob patterns or .docx files")
+    parser.add_argument('-o', '--output', default='-', help="Output file (default: stdout)")
+    parser.add_argument('--format', choices=['jsonl', 'csv'],
+                        help="Output format (default: from the output file extension, else jsonl)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes shared by parsing and scoring, which run at the same time "
+                             "(default: all cores, split evenly)")
+    parser.add_argument('--parse-workers', type=int, help="Worker processes for parsing .docx files")
+    parser.add_argument('--score-workers', type=int, help="Worker processes for scoring")
+    parser.add_argument('--top-k', type=int, help="Only write the K best candidates, ranked")
+    parser.add_argument('--cache', help="Resume cache database to reuse parsed resumes and features")
+    args = parser.parse_args()
+
+    sys.exit(screen(args))
+
+if __name__ == "__main__":
+    main()
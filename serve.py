@@ -0,0 +1,40 @@
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from utils.scoring_service import ScoringService, make_server
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local resume scoring HTTP service")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument('--model-dir', default='models', help="Directory with the trained models")
+    parser.add_argument('--max-batch', type=int, default=64,
+                        help="Most texts classified together in one micro-batch")
+    parser.add_argument('--batch-wait-ms', type=float, default=2.0,
+                        help="How long a micro-batch waits for more requests")
+    parser.add_argument('--access-log', action='store_true', help="Log every request to stderr")
+    args = parser.parse_args()
+
+    print("Loading models and NLTK data...")
+    service = ScoringService(args.model_dir, args.max_batch, args.batch_wait_ms / 1000)
+    if not service.models_loaded:
+        print("Warning: trained models not found, /classify is unavailable")
+
+    server = make_server(service, args.host, args.port, args.access_log)
+    print(f"Scoring service listening on http://{args.host}:{args.port}")
+    print("Endpoints: POST /score, POST /rank, POST /classify, GET /health")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        server.server_close()
+        service.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
+import argparse
 import os
+import statistics
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 # Add project root to path
@@ -25,8 +29,125 @@ def check_dependencies():
     
     return missing_packages
 
+def benchmark_models(texts, labels, model_types, latency_samples=200):
+    """Train every backend on the same data and report its accuracy and costs"""
+    from utils.model_trainer import ModelTrainer
+    
+    sample_texts = texts[:latency_samples]
+    results = []
+    for model_type in model_types:
+        print(f"\nBenchmarking {model_type}...")
+        trainer = ModelTrainer(model_type)
+        
+        start = time.perf_counter()
+        training = trainer.train_category_classifier(texts, labels)
+        train_time = time.perf_counter() - start
+        
+        # One resume at a time, as the GUI details view and /classify with one text do
+        single_times = []
+        for text in sample_texts:
+            start = time.perf_counter()
+            trainer.predict_category(text)
+            single_times.append(time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        trainer.predict_categories(sample_texts)
+        batch_time = (time.perf_counter() - start) / len(sample_texts)
+        
+        with tempfile.TemporaryDirectory() as model_dir:
+            trainer.save_models(model_dir)
+            model_size = os.path.getsize(os.path.join(model_dir, 'category_classifier.pkl'))
+            
+            start = time.perf_counter()
+            ModelTrainer().load_models(model_dir)
+            load_time = time.perf_counter() - start
+        
+        results.append({
+            'model': model_type,
+            'accuracy': training['accuracy'],
+            'train_time': train_time,
+            'single_ms': statistics.median(single_times) * 1000,
+            'batch_ms': batch_time * 1000,
+            'model_mb': model_size / (1024 * 1024),
+            'load_time': load_time
+        })
+    
+    print("\n" + "=" * 60)
+    print("BENCHMARK RESULTS")
+    print("=" * 60)
+    print(f"Latencies are per resume, over {len(sample_texts)} resumes; batch is one predict_categories call")
+    print("Model size is category_classifier.pkl; load time includes the shared vectorizer\n")
+    print(f"{'Model':<15}{'Accuracy':>10}{'Train (s)':>11}{'Single (ms)':>13}"
+          f"{'Batch (ms)':>12}{'Size (MB)':>11}{'Load (s)':>10}")
+    for row in results:
+        print(f"{row['model']:<15}{row['accuracy']:>10.2%}{row['train_time']:>11.2f}{row['single_ms']:>13.2f}"
+              f"{row['batch_ms']:>12.3f}{row['model_mb']:>11.2f}{row['load_time']:>10.2f}")
+    return results
+
+def train_streaming(data_loader, model_type, chunksize, shuffle_buffer, model_dir):
+    """Train out of core on CSV chunks so the full dataset never has to fit in memory"""
+    from utils.model_trainer import ModelTrainer
+    
+    print("Scanning categories...")
+    categories = data_loader.get_training_categories()
+    if not categories:
+        print("Error: No categories found. Check that the CSV has a 'Category' column.")
+        return
+    print(f"Categories found: {len(categories)}")
+    
+    print(f"\nTraining models ({model_type}, streaming {chunksize} rows at a time)...")
+    trainer = ModelTrainer(model_type)
+    results = trainer.train_category_classifier_streaming(
+        data_loader.iter_training_batches(chunksize, shuffle_buffer), categories
+    )
+    
+    print("\n" + "=" * 60)
+    print("TRAINING RESULTS")
+    print("=" * 60)
+    print(f"Trained on {results['trained_rows']} resumes, evaluated on {results['holdout_rows']} held out")
+    if results['accuracy'] is not None:
+        print(f"Accuracy: {results['accuracy']:.2%}")
+        print("\nClassification Report:")
+        print(results['report'])
+    
+    trainer.save_models(model_dir)
+    print(f"\nModels saved to {model_dir}/")
+    
+    print("\n" + "=" * 60)
+    print("SAMPLE PREDICTIONS")
+    print("=" * 60)
+    for texts, labels in data_loader.iter_training_batches(3):
+        for i, (category, confidence) in enumerate(trainer.predict_categories(texts)):
+            text = texts[i][:200] + "..." if len(texts[i]) > 200 else texts[i]
+            print(f"\nResume {i + 1}:")
+            print(f"  Sample text: {text}")
+            print(f"  Predicted: {category} (confidence: {confidence:.2%})")
+            print(f"  Actual: {labels[i]}")
+        break
+    
+    print("\n" + "=" * 60)
+    print("Training completed successfully!")
+    print("You can now run: python main.py")
+    print("=" * 60)
+
 def main():
     """Train models and save them to disk"""
+    parser = argparse.ArgumentParser(description="Train the resume category classifier")
+    parser.add_argument('--model',
+                        help="Classifier backend: random_forest (default), linear_svc, sgd or complement_nb; "
+                             "complement_nb (default) or sgd with --streaming")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Compare every backend's accuracy, training time, latency, size and load time "
+                             "instead of saving a model")
+    parser.add_argument('--streaming', action='store_true',
+                        help="Train out of core from CSV chunks, for datasets too large to load at once")
+    parser.add_argument('--chunksize', type=int, default=1000,
+                        help="Rows per chunk with --streaming (default: 1000)")
+    parser.add_argument('--shuffle-buffer', type=int, default=50000,
+                        help="Rows held to shuffle the stream with --streaming, since exports are often "
+                             "grouped by category (default: 50000, 0 to disable)")
+    args = parser.parse_args()
+    args.model = args.model or ('complement_nb' if args.streaming else 'random_forest')
     
     print("=" * 60)
     print("AI Resume Screening System - Model Training")
@@ -52,9 +173,24 @@ def main():
     
     try:
         from utils.data_loader import DataLoader
-        from utils.model_trainer import ModelTrainer
+        from utils.model_trainer import ModelTrainer, MODEL_TYPES
+        
+        if args.model not in MODEL_TYPES:
+            print(f"Error: unknown model '{args.model}'. Choose from: {', '.join(MODEL_TYPES)}")
+            return
         
         data_loader = DataLoader(data_path)
+        
+        if args.streaming:
+            if args.model not in ('sgd', 'complement_nb'):
+                print("Error: --streaming supports --model complement_nb or sgd")
+                return
+            if not os.path.exists(data_path):
+                print(f"Error: {data_path} not found. Is Resume.csv in the data/ directory?")
+                return
+            train_streaming(data_loader, args.model, args.chunksize, args.shuffle_buffer, model_dir)
+            return
+        
         df = data_loader.load_csv_data()
         
         if df.empty:
@@ -82,8 +218,12 @@ def main():
         
         print(f"\nTraining data prepared: {len(texts)} resumes, {len(labels)} labels")
         
-        print("\nTraining models...")
-        trainer = ModelTrainer()
+        if args.benchmark:
+            benchmark_models(texts, labels, list(MODEL_TYPES))
+            return
+        
+        print(f"\nTraining models ({args.model})...")
+        trainer = ModelTrainer(args.model)
         
         # Train category classifier
         results = trainer.train_category_classifier(texts, labels)
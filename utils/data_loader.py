@@ -1,12 +1,24 @@
 import pandas as pd
 import os
-from typing import List, Dict, Tuple
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Tuple, Iterable, Iterator
 import re
 
+# Contact details pulled from resume text
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b')
+
+# Only these columns are read when streaming training data; the HTML copy is skipped
+TRAINING_COLUMNS = ['Resume_str', 'Category']
+
 class DataLoader:
-    def __init__(self, csv_path: str = None):
+    def __init__(self, csv_path: str = None, cache=None):
         self.csv_path = csv_path
         self.df = None
+        self.cache = cache
         
     def load_csv_data(self) -> pd.DataFrame:
         """Load and prepare resume data from CSV for training"""
@@ -59,6 +71,22 @@ class DataLoader:
     
     def extract_resume_info_from_docx(self, docx_path: str) -> Dict:
         """Extract resume information from Word document"""
+        if self.cache is None:
+            return self._parse_resume_info(docx_path)
+        
+        content_hash = self._hash_resume_file(docx_path)
+        if content_hash is None:
+            return self._parse_resume_info(docx_path)
+        
+        cached = self.cache.get(content_hash)
+        if cached:
+            return self._with_file_fields(cached, docx_path)
+        
+        resume_info = self._parse_resume_info(docx_path)
+        return self._cache_resume_info(content_hash, resume_info)
+    
+    def _parse_resume_info(self, docx_path: str) -> Dict:
+        """Parse a Word document into a resume_info dict"""
         text = self.extract_text_from_docx(docx_path)
         if not text:
             return {}
@@ -78,6 +106,86 @@ class DataLoader:
             'file_path': docx_path
         }
     
+    def _hash_resume_file(self, docx_path: str):
+        """Hash a resume file for the cache, or None if it cannot be read"""
+        try:
+            return self.cache.hash_file(docx_path)
+        except OSError as e:
+            print(f"Error reading Word document {docx_path}: {e}")
+            return None
+    
+    def _with_file_fields(self, cached: Dict, docx_path: str) -> Dict:
+        """Attach the current path to a cached record, since equal content may live in several files"""
+        resume_info = dict(cached)
+        resume_info['filename'] = os.path.basename(docx_path)
+        resume_info['file_path'] = docx_path
+        return resume_info
+    
+    def _cache_resume_info(self, content_hash: str, resume_info: Dict) -> Dict:
+        """Store a freshly parsed resume in the cache"""
+        if resume_info.get('text'):
+            self.cache.put(content_hash, resume_info)
+            resume_info['content_hash'] = content_hash
+        return resume_info
+    
+    def iter_resume_infos(self, docx_paths: Iterable[str], workers: int = None,
+                          chunk_size: int = 8) -> Iterator[Tuple[str, Dict]]:
+        """Parse many Word resumes in a process pool and yield (path, resume_info)
+        
+        Files found in the cache are yielded first; the rest follow in input order.
+        """
+        docx_paths = list(docx_paths)
+        
+        # Serve cache hits without parsing anything
+        hashes = {}
+        if self.cache is not None:
+            misses = []
+            for docx_path in docx_paths:
+                content_hash = self._hash_resume_file(docx_path)
+                cached = self.cache.get(content_hash) if content_hash else None
+                if cached:
+                    yield docx_path, self._with_file_fields(cached, docx_path)
+                else:
+                    hashes[docx_path] = content_hash
+                    misses.append(docx_path)
+            docx_paths = misses
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        # A pool is not worth starting for a handful of files
+        if workers <= 1 or len(docx_paths) < 2 * chunk_size:
+            for docx_path in docx_paths:
+                resume_info = self._parse_resume_info(docx_path)
+                yield docx_path, self._cache_parsed(hashes, docx_path, resume_info)
+            if self.cache is not None:
+                self.cache.flush()
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep a bounded number of chunks in flight so parsed texts never pile
+            # up ahead of a slower consumer
+            remaining = iter(docx_paths)
+            chunks = iter(lambda: list(islice(remaining, chunk_size)), [])
+            pending = deque(executor.submit(_parse_resume_files, chunk) for chunk in islice(chunks, workers * 2))
+            
+            while pending:
+                parsed = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(_parse_resume_files, chunk))
+                for docx_path, resume_info in parsed:
+                    yield docx_path, self._cache_parsed(hashes, docx_path, resume_info)
+        
+        # Commit the last partial batch of cache writes
+        if self.cache is not None:
+            self.cache.flush()
+    
+    def _cache_parsed(self, hashes: Dict[str, str], docx_path: str, resume_info: Dict) -> Dict:
+        """Cache a resume parsed by iter_resume_infos when its hash is known"""
+        if hashes.get(docx_path):
+            return self._cache_resume_info(hashes[docx_path], resume_info)
+        return resume_info
+    
     def _extract_name_from_text(self, text: str, filename: str) -> str:
         """Extract name from resume text"""
         # Simple extraction - first line often contains name
@@ -90,15 +198,13 @@ class DataLoader:
     
     def _extract_email_from_text(self, text: str) -> str:
         """Extract email from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else ""
+        match = EMAIL_RE.search(text)
+        return match.group() if match else ""
     
     def _extract_phone_from_text(self, text: str) -> str:
         """Extract phone number from text"""
-        phone_pattern = r'\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b'
-        phones = re.findall(phone_pattern, text)
-        return phones[0] if phones else ""
+        match = PHONE_RE.search(text)
+        return match.group() if match else ""
     
     def get_resume_by_category(self, category: str) -> pd.DataFrame:
         """Filter resumes by category"""
@@ -129,10 +235,78 @@ class DataLoader:
         
         return [], []
     
+    def get_training_categories(self, chunksize: int = 100000) -> List[str]:
+        """Collect every category in the CSV by streaming only the Category column"""
+        categories = set()
+        try:
+            with pd.read_csv(self.csv_path, usecols=['Category'], dtype={'Category': 'category'},
+                             chunksize=chunksize) as reader:
+                for chunk in reader:
+                    categories.update(str(category) for category in chunk['Category'].dropna().unique())
+        except Exception as e:
+            print(f"Error reading categories from CSV: {e}")
+            return []
+        return sorted(categories)
+    
+    def iter_training_batches(self, chunksize: int = 1000, shuffle_buffer: int = 0,
+                              seed: int = 42) -> Iterator[Tuple[List[str], List[str]]]:
+        """Yield (texts, labels) batches from the CSV without loading the whole file
+        
+        With shuffle_buffer, rows pass through a buffer of that many rows and leave it in random
+        order, so exports grouped by category still give incremental learners mixed batches.
+        """
+        if not self.csv_path or not os.path.exists(self.csv_path):
+            print(f"Warning: CSV file not found at {self.csv_path}")
+            return
+        
+        rng = random.Random(seed)
+        buffer = []
+        texts, labels = [], []
+        try:
+            with pd.read_csv(self.csv_path, usecols=TRAINING_COLUMNS, dtype={'Category': 'category'},
+                             chunksize=chunksize) as reader:
+                for chunk in reader:
+                    chunk = chunk.dropna(subset=['Category'])
+                    rows = zip(chunk['Resume_str'].fillna('').astype(str).tolist(),
+                               chunk['Category'].astype(str).tolist())
+                    for row in rows:
+                        if shuffle_buffer > 0:
+                            if len(buffer) < shuffle_buffer:
+                                buffer.append(row)
+                                continue
+                            # Swap the new row into a random slot and emit the row it replaces
+                            slot = rng.randrange(shuffle_buffer)
+                            row, buffer[slot] = buffer[slot], row
+                        texts.append(row[0])
+                        labels.append(row[1])
+                        if len(texts) >= chunksize:
+                            yield texts, labels
+                            texts, labels = [], []
+        except ValueError as e:
+            # usecols raises ValueError when a training column is missing
+            print(f"Error loading CSV: {e}")
+            return
+        
+        rng.shuffle(buffer)
+        for text, label in buffer:
+            texts.append(text)
+            labels.append(label)
+            if len(texts) >= chunksize:
+                yield texts, labels
+                texts, labels = [], []
+        if texts:
+            yield texts, labels
+    
     def get_sample_data(self, n_samples: int = 5) -> pd.DataFrame:
         """Get sample data for testing"""
         if self.df is None:
             self.load_csv_data()
         if self.df is not None and not self.df.empty:
             return self.df.head(n_samples)
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+
+def _parse_resume_files(docx_paths: List[str]) -> List[Tuple[str, Dict]]:
+    """Parse a chunk of Word resumes inside a worker process"""
+    data_loader = DataLoader()
+    return [(docx_path, data_loader._parse_resume_info(docx_path)) for docx_path in docx_paths]
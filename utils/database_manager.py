@@ -1,20 +1,158 @@
+import re
 import sqlite3
+import threading
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator
+
+# Statements are kept as constants so sqlite3's per-connection statement cache reuses them
+INSERT_APPLICANT_SQL = '''
+INSERT INTO applicants 
+(name, email, phone, resume_text, file_path, category, score, missing_skills, processed_date)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+INSERT_APPLICANT_WITH_ID_SQL = '''
+INSERT INTO applicants 
+(id, name, email, phone, resume_text, file_path, category, score, missing_skills, processed_date)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+INSERT_SKILL_SQL = '''
+INSERT INTO skills (applicant_id, skill_category, skill_name)
+VALUES (?, ?, ?)
+'''
+
+# Full-text index over the searchable applicant columns, kept in sync by triggers
+CREATE_FTS_SQL = [
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS applicants_fts USING fts5(
+        name, email, resume_text,
+        content='applicants', content_rowid='id'
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS applicants_fts_insert AFTER INSERT ON applicants BEGIN
+        INSERT INTO applicants_fts (rowid, name, email, resume_text)
+        VALUES (new.id, new.name, new.email, new.resume_text);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS applicants_fts_delete AFTER DELETE ON applicants BEGIN
+        INSERT INTO applicants_fts (applicants_fts, rowid, name, email, resume_text)
+        VALUES ('delete', old.id, old.name, old.email, old.resume_text);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS applicants_fts_update AFTER UPDATE ON applicants BEGIN
+        INSERT INTO applicants_fts (applicants_fts, rowid, name, email, resume_text)
+        VALUES ('delete', old.id, old.name, old.email, old.resume_text);
+        INSERT INTO applicants_fts (rowid, name, email, resume_text)
+        VALUES (new.id, new.name, new.email, new.resume_text);
+    END
+    '''
+]
+
+# Columns shown in applicant lists and search results
+APPLICANT_LIST_COLUMNS = '''
+    a.id, a.name, a.email, a.phone, a.category, a.score, 
+    a.missing_skills, a.processed_date
+'''
 
 class DatabaseManager:
     def __init__(self, db_path: str = "resumes.db"):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections = {}
+        self._connections_lock = threading.Lock()
+        self._generation = 0
+        self.fts_enabled = False
         self._init_database()
     
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return this thread's long-lived connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.generation == self._generation:
+            return conn
+        
+        # Connections are only used by their own thread; close() may run on another
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA cache_size=-20000')  # About 20 MB of page cache
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA foreign_keys=ON')
+        
+        self._local.conn = conn
+        self._local.generation = self._generation
+        with self._connections_lock:
+            self._connections[threading.get_ident()] = conn
+        return conn
+    
+    def close(self):
+        """Close every connection opened by this manager"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, {}
+            self._generation += 1
+        
+        for conn in connections.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+    
+    def release_connection(self):
+        """Close the calling thread's connection, for worker threads that are about to exit"""
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        
+        with self._connections_lock:
+            if self._connections.get(threading.get_ident()) is conn:
+                del self._connections[threading.get_ident()]
+        
+        if conn is not None:
+            conn.close()
+    
+    def interrupt(self, thread_id: int):
+        """Abort the query currently running on another thread's connection"""
+        with self._connections_lock:
+            conn = self._connections.get(thread_id)
+        if conn is not None:
+            conn.interrupt()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def _init_database(self):
-        """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Create the database or upgrade an existing one to the current schema version"""
+        conn = self._get_connection()
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        
+        # Each migration runs in its own transaction together with its version bump
+        for target_version, migration in enumerate(self._migrations(), start=1):
+            if version < target_version:
+                with conn:
+                    conn.execute('BEGIN')
+                    migration(conn)
+                    conn.execute(f'PRAGMA user_version = {target_version}')
         
+        self._init_fts(conn)
+    
+    def _migrations(self) -> List:
+        """Schema migrations in order; the database's user_version counts how many have run"""
+        return [
+            self._migrate_create_tables,
+            self._migrate_add_indexes,
+            self._migrate_add_metadata,
+        ]
+    
+    def _migrate_create_tables(self, conn: sqlite3.Connection):
+        """Version 1: the original applicants and skills tables"""
         # Create applicants table
-        cursor.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS applicants (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -31,7 +169,7 @@ class DatabaseManager:
         ''')
         
         # Create skills table
-        cursor.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS skills (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             applicant_id INTEGER,
@@ -40,20 +178,66 @@ class DatabaseManager:
             FOREIGN KEY (applicant_id) REFERENCES applicants (id)
         )
         ''')
+    
+    def _migrate_add_indexes(self, conn: sqlite3.Connection):
+        """Version 2: secondary indexes and ON DELETE CASCADE from skills to applicants"""
+        # SQLite cannot alter a foreign key, so the skills table is rebuilt
+        conn.execute('''
+        CREATE TABLE skills_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            applicant_id INTEGER,
+            skill_category TEXT,
+            skill_name TEXT,
+            FOREIGN KEY (applicant_id) REFERENCES applicants (id) ON DELETE CASCADE
+        )
+        ''')
+        
+        # Orphaned skill rows would violate the enforced foreign key, so they are dropped
+        conn.execute('''
+        INSERT INTO skills_new (id, applicant_id, skill_category, skill_name)
+        SELECT id, applicant_id, skill_category, skill_name FROM skills
+        WHERE applicant_id IN (SELECT id FROM applicants)
+        ''')
+        conn.execute('DROP TABLE skills')
+        conn.execute('ALTER TABLE skills_new RENAME TO skills')
         
-        conn.commit()
-        conn.close()
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_skills_applicant_id ON skills (applicant_id)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_applicants_score ON applicants (score)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_applicants_category ON applicants (category)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_applicants_email ON applicants (email)')
     
-    def add_applicant(self, applicant_data: Dict) -> int:
-        """Add a new applicant to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def _migrate_add_metadata(self, conn: sqlite3.Connection):
+        """Version 3: key/value metadata, starting with a counter bumped whenever all data is cleared"""
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS metadata (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+        ''')
+        conn.execute("INSERT OR IGNORE INTO metadata (key, value) VALUES ('data_generation', 0)")
+    
+    def _init_fts(self, conn: sqlite3.Connection):
+        """Create the FTS5 search index, back-filling it for databases created before it existed"""
+        has_index = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'applicants_fts'"
+        ).fetchone() is not None
         
-        cursor.execute('''
-        INSERT INTO applicants 
-        (name, email, phone, resume_text, file_path, category, score, missing_skills, processed_date)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        try:
+            with conn:
+                for statement in CREATE_FTS_SQL:
+                    conn.execute(statement)
+                
+                # Migrate existing databases by indexing rows that were already stored
+                if not has_index:
+                    conn.execute("INSERT INTO applicants_fts (applicants_fts) VALUES ('rebuild')")
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            # SQLite builds without FTS5 fall back to LIKE searches
+            print(f"Full-text search unavailable, using slower search: {e}")
+    
+    def _applicant_row(self, applicant_data: Dict) -> tuple:
+        """Column values for an applicant insert"""
+        return (
             applicant_data.get('name', ''),
             applicant_data.get('email', ''),
             applicant_data.get('phone', ''),
@@ -63,26 +247,62 @@ class DatabaseManager:
             applicant_data.get('score', 0.0),
             applicant_data.get('missing_skills', ''),
             applicant_data.get('processed_date', datetime.now())
-        ))
-        
-        applicant_id = cursor.lastrowid
+        )
+    
+    def _skill_rows(self, applicant_id: int, applicant_data: Dict) -> List[tuple]:
+        """Skill rows for an applicant, if skills were provided"""
+        return [
+            (applicant_id, category, skill)
+            for category, skills in applicant_data.get('skills', {}).items()
+            for skill in skills
+        ]
+    
+    def add_applicant(self, applicant_data: Dict) -> int:
+        """Add a new applicant to the database"""
+        conn = self._get_connection()
         
-        # Add skills if provided
-        if 'skills' in applicant_data:
-            for category, skills in applicant_data['skills'].items():
-                for skill in skills:
-                    cursor.execute('''
-                    INSERT INTO skills (applicant_id, skill_category, skill_name)
-                    VALUES (?, ?, ?)
-                    ''', (applicant_id, category, skill))
+        with conn:
+            cursor = conn.execute(INSERT_APPLICANT_SQL, self._applicant_row(applicant_data))
+            applicant_id = cursor.lastrowid
+            
+            # Add skills if provided
+            conn.executemany(INSERT_SKILL_SQL, self._skill_rows(applicant_id, applicant_data))
         
-        conn.commit()
-        conn.close()
         return applicant_id
     
+    def add_applicants_bulk(self, applicants: Iterable[Dict]) -> List[int]:
+        """Add many applicants and their skills in a single transaction, returning the new IDs"""
+        applicants = list(applicants)
+        if not applicants:
+            return []
+        
+        conn = self._get_connection()
+        
+        with conn:
+            # Take the write lock first so the ID range cannot be claimed by another writer
+            conn.execute('BEGIN IMMEDIATE')
+            
+            # Assign IDs explicitly so executemany can be used and the IDs returned
+            max_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM applicants').fetchone()[0]
+            seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'applicants'").fetchone()
+            first_id = max(max_id, seq[0] if seq else 0) + 1
+            applicant_ids = list(range(first_id, first_id + len(applicants)))
+            
+            conn.executemany(INSERT_APPLICANT_WITH_ID_SQL, [
+                (applicant_id, *self._applicant_row(applicant_data))
+                for applicant_id, applicant_data in zip(applicant_ids, applicants)
+            ])
+            conn.executemany(INSERT_SKILL_SQL, [
+                row
+                for applicant_id, applicant_data in zip(applicant_ids, applicants)
+                for row in self._skill_rows(applicant_id, applicant_data)
+            ])
+        
+        return applicant_ids
+    
     def get_all_applicants(self, order_by_score: bool = False) -> pd.DataFrame:
         """Get all applicants from database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         
         query = '''
         SELECT 
@@ -94,13 +314,11 @@ class DatabaseManager:
         if order_by_score:
             query += ' ORDER BY score DESC'
         
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df
+        return pd.read_sql_query(query, conn)
     
     def get_applicant_by_id(self, applicant_id: int) -> Optional[Dict]:
         """Get applicant details by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -109,7 +327,6 @@ class DatabaseManager:
         
         row = cursor.fetchone()
         if not row:
-            conn.close()
             return None
         
         # Get column names
@@ -131,64 +348,217 @@ class DatabaseManager:
             skills[category].append(skill)
         
         applicant['skills'] = skills
-        conn.close()
         return applicant
     
-    def search_applicants(self, keyword: str, min_score: float = 0.0) -> pd.DataFrame:
-        """Search applicants by keyword"""
-        conn = sqlite3.connect(self.db_path)
+    def search_applicants(self, keyword: str, min_score: float = 0.0, ranked: bool = False,
+                          prefix: bool = True, limit: int = None) -> pd.DataFrame:
+        """Search applicants by keyword
         
-        query = '''
-        SELECT 
-            id, name, email, phone, category, score, 
-            missing_skills, processed_date
-        FROM applicants
-        WHERE (name LIKE ? OR email LIKE ? OR resume_text LIKE ?)
-          AND score >= ?
-        ORDER BY score DESC
+        Every word in the keyword must match the name, email or resume text. With
+        prefix=True words also match as prefixes ("pyth" finds "python"). With
+        ranked=True results are ordered by bm25 relevance instead of score.
+        """
+        conn = self._get_connection()
+        from_sql, conditions, params = self._filter_sql(keyword, min_score, prefix)
+        
+        # Name and email hits outrank hits in the resume body
+        if ranked and 'applicants_fts' in from_sql:
+            order = 'bm25(applicants_fts, 10.0, 5.0, 1.0)'
+        else:
+            order = 'a.score DESC'
+        
+        query = f'''
+        SELECT {APPLICANT_LIST_COLUMNS}
+        FROM {from_sql}
+        WHERE {' AND '.join(conditions)}
+        ORDER BY {order}
         '''
         
+        if limit:
+            query += ' LIMIT ?'
+            params.append(limit)
+        
+        return pd.read_sql_query(query, conn, params=params)
+    
+    def get_applicants_page(self, limit: int = 100, after: tuple = None, before: tuple = None,
+                            order_by_score: bool = False, keyword: str = '',
+                            min_score: float = 0.0, within_ids: List[int] = None) -> List[Dict]:
+        """Fetch one page of applicants with a keyset cursor instead of OFFSET
+        
+        Rows are ordered by id, or by (score, id) descending when order_by_score
+        is set. Pass the key of the last row as after= for the next page, or the
+        key of the first row as before= for the previous one; keys come from
+        page_key(). within_ids restricts the page to a known set of applicants.
+        """
+        conn = self._get_connection()
+        from_sql, conditions, params = self._filter_sql(keyword, min_score, within_ids=within_ids)
+        
+        if order_by_score:
+            key_sql, forward, backward = '(a.score, a.id)', 'a.score DESC, a.id DESC', 'a.score, a.id'
+            after_op, before_op = '<', '>'
+        else:
+            key_sql, forward, backward = 'a.id', 'a.id', 'a.id DESC'
+            after_op, before_op = '>', '<'
+        
+        order = forward
+        reverse = False
+        if after is not None:
+            conditions.append(f"{key_sql} {after_op} ({', '.join('?' * len(after))})")
+            params.extend(after)
+        elif before is not None:
+            conditions.append(f"{key_sql} {before_op} ({', '.join('?' * len(before))})")
+            params.extend(before)
+            order = backward
+            reverse = True
+        
+        cursor = conn.execute(f'''
+        SELECT {APPLICANT_LIST_COLUMNS}
+        FROM {from_sql}
+        WHERE {' AND '.join(conditions)}
+        ORDER BY {order}
+        LIMIT ?
+        ''', params + [limit])
+        
+        columns = [description[0] for description in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        
+        # Pages fetched backwards are returned in display order
+        if reverse:
+            rows.reverse()
+        return rows
+    
+    def iter_resume_batches(self, after_id: int = 0, batch_size: int = 5000) -> Iterator[List[tuple]]:
+        """Yield (id, resume_text) rows in id order, batch by batch, for applicants after after_id"""
+        conn = self._get_connection()
+        while True:
+            rows = conn.execute('''
+            SELECT id, resume_text FROM applicants WHERE id > ? ORDER BY id LIMIT ?
+            ''', (after_id, batch_size)).fetchall()
+            if not rows:
+                return
+            yield rows
+            after_id = rows[-1][0]
+    
+    def get_applicant_ids(self) -> List[int]:
+        """IDs of every stored applicant, in id order"""
+        conn = self._get_connection()
+        return [row[0] for row in conn.execute('SELECT id FROM applicants ORDER BY id')]
+    
+    def get_data_generation(self) -> int:
+        """Counter that changes whenever clear_all_data runs, since IDs are reused afterwards"""
+        conn = self._get_connection()
+        row = conn.execute("SELECT value FROM metadata WHERE key = 'data_generation'").fetchone()
+        return row[0] if row else 0
+    
+    def page_key(self, row: Dict, order_by_score: bool = False) -> tuple:
+        """Keyset cursor of a row returned by get_applicants_page"""
+        return (row['score'], row['id']) if order_by_score else (row['id'],)
+    
+    def count_applicants(self, keyword: str = '', min_score: float = 0.0,
+                         within_ids: List[int] = None) -> int:
+        """Count applicants matching a keyword and minimum score"""
+        conn = self._get_connection()
+        from_sql, conditions, params = self._filter_sql(keyword, min_score, within_ids=within_ids)
+        
+        return conn.execute(f'''
+        SELECT COUNT(*) FROM {from_sql} WHERE {' AND '.join(conditions)}
+        ''', params).fetchone()[0]
+    
+    def get_matching_ids(self, keyword: str = '', min_score: float = 0.0,
+                         within_ids: List[int] = None, limit: int = 900) -> Optional[List[int]]:
+        """IDs of all matching applicants, or None if there are more than limit"""
+        conn = self._get_connection()
+        from_sql, conditions, params = self._filter_sql(keyword, min_score, within_ids=within_ids)
+        
+        ids = [row[0] for row in conn.execute(f'''
+        SELECT a.id FROM {from_sql} WHERE {' AND '.join(conditions)} LIMIT ?
+        ''', params + [limit + 1])]
+        return ids if len(ids) <= limit else None
+    
+    def _filter_sql(self, keyword: str, min_score: float, prefix: bool = True,
+                    within_ids: List[int] = None):
+        """FROM clause, WHERE conditions and parameters for a keyword and score filter"""
+        conditions = ['a.score >= ?']
+        params = [min_score]
+        
+        # Narrow to a previous result set, e.g. while a search keyword is being extended
+        if within_ids is not None:
+            conditions.append(f"a.id IN ({', '.join('?' * len(within_ids)) or 'NULL'})")
+            params.extend(within_ids)
+        
+        mode = self.search_mode(keyword)
+        if mode == 'all':
+            return 'applicants a', conditions, params
+        
+        if mode == 'fts':
+            fts_query = self._build_fts_query(keyword, prefix)
+            conditions.insert(0, 'applicants_fts MATCH ?')
+            params.insert(0, fts_query)
+            return 'applicants_fts JOIN applicants a ON a.id = applicants_fts.rowid', conditions, params
+        
+        # Substring search, used when SQLite has no FTS5 support or the keyword is not plain words
         search_term = f'%{keyword}%'
-        df = pd.read_sql_query(query, conn, params=(search_term, search_term, search_term, min_score))
-        conn.close()
-        return df
+        conditions.insert(0, '(a.name LIKE ? OR a.email LIKE ? OR a.resume_text LIKE ?)')
+        params[:0] = [search_term, search_term, search_term]
+        return 'applicants a', conditions, params
+    
+    def search_mode(self, keyword: str) -> str:
+        """How a keyword is searched: 'fts', 'like' (substring) or 'all' when there is nothing to match"""
+        if not (keyword or '').strip():
+            return 'all'
+        if self.fts_enabled and self._is_word_query(keyword) and self._build_fts_query(keyword) is not None:
+            return 'fts'
+        return 'like'
+    
+    def _is_word_query(self, keyword: str) -> bool:
+        """Whether FTS can search a keyword without losing meaning
+        
+        The FTS tokenizer drops symbols, so "c++", "c#" and ".net" would become the
+        bare prefix "c" or "net" and match far more than they should.
+        """
+        if re.search(r'[^\w\s]', keyword):
+            return False
+        return all(len(term) > 1 for term in re.findall(r'\w+', keyword))
+    
+    def _build_fts_query(self, keyword: str, prefix: bool = True) -> Optional[str]:
+        """Turn free text into an FTS5 query of quoted (prefix) terms, or None if it has no words"""
+        terms = re.findall(r'\w+', keyword or '')
+        if not terms:
+            return None
+        suffix = '*' if prefix else ''
+        return ' '.join(f'"{term}"{suffix}' for term in terms)
     
     def delete_applicant(self, applicant_id: int) -> bool:
         """Delete applicant from database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Delete skills first
-            cursor.execute('DELETE FROM skills WHERE applicant_id = ?', (applicant_id,))
+            conn = self._get_connection()
             
-            # Delete applicant
-            cursor.execute('DELETE FROM applicants WHERE id = ?', (applicant_id,))
+            with conn:
+                # Skills are removed by ON DELETE CASCADE
+                cursor = conn.execute('DELETE FROM applicants WHERE id = ?', (applicant_id,))
             
-            conn.commit()
-            conn.close()
             return cursor.rowcount > 0
         except:
             return False
     
     def clear_all_data(self):
         """Clear all data from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM skills')
-        cursor.execute('DELETE FROM applicants')
-        
-        # Reset autoincrement
-        cursor.execute('DELETE FROM sqlite_sequence WHERE name="applicants"')
-        cursor.execute('DELETE FROM sqlite_sequence WHERE name="skills"')
+        conn = self._get_connection()
         
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute('DELETE FROM skills')
+            conn.execute('DELETE FROM applicants')
+            
+            # Reset autoincrement
+            conn.execute('DELETE FROM sqlite_sequence WHERE name="applicants"')
+            conn.execute('DELETE FROM sqlite_sequence WHERE name="skills"')
+            
+            # IDs start again at 1, so caches keyed by applicant ID must be rebuilt
+            conn.execute("UPDATE metadata SET value = value + 1 WHERE key = 'data_generation'")
     
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('SELECT COUNT(*) FROM applicants')
@@ -212,8 +582,6 @@ class DatabaseManager:
                 'avg_score': row[2] or 0
             })
         
-        conn.close()
-        
         return {
             'total_applicants': total_applicants,
             'average_score': avg_score,
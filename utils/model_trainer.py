@@ -1,15 +1,30 @@
 import joblib
 import numpy as np
 import os
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
 from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+from sklearn.naive_bayes import ComplementNB
+from sklearn.svm import LinearSVC
 from sklearn.metrics import classification_report, accuracy_score
-from typing import Tuple, Dict, Any, List
+from typing import Tuple, Dict, Any, List, Iterable
+from scipy import sparse
+
+# Category classifier backends, all trained on the same TF-IDF features
+MODEL_TYPES = {
+    'random_forest': lambda: RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1),
+    'linear_svc': lambda: LinearSVC(C=1.0, dual='auto', random_state=42),
+    'sgd': lambda: SGDClassifier(loss='log_loss', alpha=1e-5, max_iter=50, tol=1e-3, random_state=42),
+    'complement_nb': lambda: ComplementNB(alpha=0.3),
+}
 
 class ModelTrainer:
-    def __init__(self):
+    def __init__(self, model_type: str = 'random_forest'):
+        if model_type not in MODEL_TYPES:
+            raise ValueError(f"Unknown model type '{model_type}', expected one of: {', '.join(MODEL_TYPES)}")
+        
         self.vectorizer = TfidfVectorizer(
             max_features=5000,
             ngram_range=(1, 2),
@@ -18,11 +33,8 @@ class ModelTrainer:
             max_df=0.8
         )
         self.label_encoder = LabelEncoder()
-        self.category_classifier = RandomForestClassifier(
-            n_estimators=100,
-            random_state=42,
-            n_jobs=-1
-        )
+        self.model_type = model_type
+        self.category_classifier = MODEL_TYPES[model_type]()
         
     def train_category_classifier(self, texts: List[str], labels: List[str]) -> Dict[str, Any]:
         """Train category classification model"""
@@ -56,6 +68,74 @@ class ModelTrainer:
             'classes': self.label_encoder.classes_.tolist()
         }
     
+    def train_category_classifier_streaming(self, batches: Iterable[Tuple[List[str], List[str]]],
+                                            classes: List[str], holdout_every: int = 5,
+                                            max_holdout: int = 5000, n_features: int = 2 ** 18) -> Dict[str, Any]:
+        """Train out of core on (texts, labels) batches with a HashingVectorizer and partial_fit
+        
+        Every holdout_every-th row is kept back for evaluation until max_holdout rows are held,
+        so memory stays bounded by one batch plus the held-out rows.
+        """
+        if not hasattr(self.category_classifier, 'partial_fit'):
+            raise ValueError(f"Model type '{self.model_type}' cannot be trained incrementally, use sgd or complement_nb")
+        
+        # A hashing vectorizer needs no vocabulary pass; unsigned features keep ComplementNB valid
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=(1, 2),
+            stop_words='english',
+            alternate_sign=False,
+            norm='l2'
+        )
+        self.label_encoder.fit(classes)
+        all_classes = np.arange(len(self.label_encoder.classes_))
+        
+        holdout_vecs, holdout_labels = [], []
+        held_out = 0
+        trained = 0
+        seen = 0
+        for texts, labels in batches:
+            text_vecs = self.vectorizer.transform(self._clean_texts(texts))
+            encoded_labels = self.label_encoder.transform(labels)
+            
+            # Row positions across the whole stream decide the split, not the batch layout
+            positions = np.arange(seen, seen + len(texts))
+            seen += len(texts)
+            holdout = positions % holdout_every == 0
+            if held_out + holdout.sum() > max_holdout:
+                holdout[np.flatnonzero(holdout)[max_holdout - held_out:]] = False
+            
+            if holdout.any():
+                holdout_vecs.append(text_vecs[holdout])
+                holdout_labels.append(encoded_labels[holdout])
+                held_out += int(holdout.sum())
+            
+            train = ~holdout
+            if train.any():
+                self.category_classifier.partial_fit(text_vecs[train], encoded_labels[train], classes=all_classes)
+                trained += int(train.sum())
+        
+        if not trained:
+            raise ValueError("No training rows were read")
+        
+        # Evaluate
+        results = {
+            'accuracy': None,
+            'report': '',
+            'classes': self.label_encoder.classes_.tolist(),
+            'trained_rows': trained,
+            'holdout_rows': held_out
+        }
+        if holdout_vecs:
+            y_test = np.concatenate(holdout_labels)
+            y_pred = self.category_classifier.predict(sparse.vstack(holdout_vecs))
+            results['accuracy'] = accuracy_score(y_test, y_pred)
+            results['report'] = classification_report(
+                y_test, y_pred, labels=all_classes,
+                target_names=self.label_encoder.classes_, zero_division=0
+            )
+        return results
+    
     def _clean_texts(self, texts: List[str]) -> List[str]:
         """Clean a list of texts"""
         cleaned = []
@@ -71,28 +151,43 @@ class ModelTrainer:
     
     def predict_category(self, text: str) -> Tuple[str, float]:
         """Predict category for a single resume"""
-        if not isinstance(text, str):
-            return "Unknown", 0.0
-        
-        # Clean text
-        cleaned_text = text.lower()
-        cleaned_text = ' '.join(cleaned_text.split())
+        return self.predict_categories([text])[0]
+    
+    def predict_categories(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """Predict (category, confidence) for a batch of resumes with one vectorizer and classifier call"""
+        results = [("Unknown", 0.0)] * len(texts)
+        rows = [i for i, text in enumerate(texts) if isinstance(text, str)]
+        if not rows:
+            return results
         
-        # Vectorize
-        text_vec = self.vectorizer.transform([cleaned_text])
+        # Vectorize the whole batch at once
+        text_vecs = self.vectorizer.transform(self._clean_texts([texts[i] for i in rows]))
         
         # Predict
-        proba = self.category_classifier.predict_proba(text_vec)[0]
-        pred_idx = np.argmax(proba)
-        confidence = proba[pred_idx]
+        proba = self._predict_proba(text_vecs)
+        pred_idx = np.argmax(proba, axis=1)
+        confidences = proba[np.arange(len(rows)), pred_idx]
         
-        # Get category name
+        # Get category names
         try:
-            category = self.label_encoder.inverse_transform([pred_idx])[0]
-        except:
-            category = "Unknown"
+            categories = self.label_encoder.inverse_transform(pred_idx)
+        except Exception:
+            categories = ["Unknown"] * len(rows)
+        
+        for i, category, confidence in zip(rows, categories, confidences):
+            results[i] = (str(category), float(confidence))
+        return results
+    
+    def _predict_proba(self, text_vecs) -> np.ndarray:
+        """Class probabilities, from a softmax over decision scores for margin classifiers like LinearSVC"""
+        if hasattr(self.category_classifier, 'predict_proba'):
+            return self.category_classifier.predict_proba(text_vecs)
         
-        return category, confidence
+        scores = self.category_classifier.decision_function(text_vecs)
+        if scores.ndim == 1:
+            scores = np.column_stack([-scores, scores])
+        scores = np.exp(scores - scores.max(axis=1, keepdims=True))
+        return scores / scores.sum(axis=1, keepdims=True)
     
     def save_models(self, model_dir: str):
         """Save trained models to disk"""
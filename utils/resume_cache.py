@@ -0,0 +1,222 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Iterable, Tuple
+
+class ResumeCache:
+    """Persistent cache of parsed resumes keyed by the SHA-256 of the file contents
+
+    Each record keeps the extracted text and contact fields, plus the
+    job-independent features (skills and keyword counts) once a screening has
+    computed them. The cache is bounded by max_bytes and evicts the least
+    recently used records first.
+
+    Features are stored with features_version, the fingerprint of the
+    extractor that produced them (SimilarityScorer.features_version). get()
+    leaves out features written under any other version, so a changed skill
+    vocabulary or keyword count is recomputed rather than reused.
+
+    Writes are grouped into transactions of up to commit_every records and
+    access times are recorded in memory, so a large screening does not pay for
+    one commit per resume. flush() or close() writes everything pending.
+    """
+    def __init__(self, db_path: str = "resume_cache.db", max_bytes: int = 256 * 1024 * 1024,
+                 commit_every: int = 256, features_version: Optional[str] = None):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.commit_every = commit_every
+        self.features_version = features_version
+        self._lock = threading.Lock()
+        self._uncommitted = 0
+        self._accessed = {}
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._init_database()
+        self._total_bytes = self._conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM resume_cache'
+        ).fetchone()[0]
+
+    def _init_database(self):
+        """Create the cache table"""
+        self._conn.execute('''
+        CREATE TABLE IF NOT EXISTS resume_cache (
+            content_hash TEXT PRIMARY KEY,
+            name TEXT,
+            email TEXT,
+            phone TEXT,
+            text TEXT,
+            features TEXT,
+            features_version TEXT,
+            size INTEGER,
+            last_access REAL
+        )
+        ''')
+        # Caches created before features were versioned; their features never match
+        columns = [col[1] for col in self._conn.execute('PRAGMA table_info(resume_cache)')]
+        if 'features_version' not in columns:
+            self._conn.execute('ALTER TABLE resume_cache ADD COLUMN features_version TEXT')
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_resume_cache_last_access ON resume_cache (last_access)'
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """Hash a file's contents in blocks"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 16), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, content_hash: str) -> Optional[Dict]:
+        """Return the cached record for a content hash and mark it as recently used"""
+        with self._lock:
+            row = self._conn.execute('''
+            SELECT name, email, phone, text, features, features_version FROM resume_cache
+            WHERE content_hash = ?
+            ''', (content_hash,)).fetchone()
+            if not row:
+                return None
+
+            # Written with the next batch of changes rather than committed per read
+            self._accessed[content_hash] = time.time()
+
+        record = {
+            'name': row[0],
+            'email': row[1],
+            'phone': row[2],
+            'text': row[3],
+            'content_hash': content_hash
+        }
+        if row[4] and row[5] == self.features_version:
+            record['features'] = json.loads(row[4])
+        return record
+
+    def put(self, content_hash: str, resume_info: Dict):
+        """Store a parsed resume, replacing any previous record for the same content"""
+        features = resume_info.get('features')
+        features_json = json.dumps(features) if features else None
+        size = self._record_size(resume_info.get('text', ''), features_json)
+
+        with self._lock:
+            self._discount(content_hash)
+            self._conn.execute('''
+            INSERT INTO resume_cache (content_hash, name, email, phone, text, features, features_version,
+                                      size, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                content_hash,
+                resume_info.get('name', ''),
+                resume_info.get('email', ''),
+                resume_info.get('phone', ''),
+                resume_info.get('text', ''),
+                features_json,
+                self.features_version if features_json else None,
+                size,
+                time.time()
+            ))
+            self._total_bytes += size
+            self._accessed.pop(content_hash, None)
+            self._evict()
+            self._record_written(1)
+
+    def update_features(self, content_hash: str, features: Dict):
+        """Attach skills and keyword counts computed during screening to a cached record"""
+        self.update_features_many([(content_hash, features)])
+
+    def update_features_many(self, items: Iterable[Tuple[str, Dict]]):
+        """Attach features to many cached records in one transaction"""
+        now = time.time()
+        with self._lock:
+            count = 0
+            for content_hash, features in items:
+                features_json = json.dumps(features)
+                row = self._conn.execute('SELECT text, size FROM resume_cache WHERE content_hash = ?',
+                                         (content_hash,)).fetchone()
+                if not row:
+                    continue
+
+                size = self._record_size(row[0], features_json)
+                self._conn.execute('''
+                UPDATE resume_cache SET features = ?, features_version = ?, size = ?, last_access = ?
+                WHERE content_hash = ?
+                ''', (features_json, self.features_version, size, now, content_hash))
+                self._total_bytes += size - row[1]
+                self._accessed.pop(content_hash, None)
+                count += 1
+
+            if count:
+                self._evict()
+                self._record_written(count)
+
+    def flush(self):
+        """Commit pending writes and recorded access times"""
+        with self._lock:
+            self._commit()
+
+    def clear(self):
+        """Remove every cached record"""
+        with self._lock:
+            self._accessed.clear()
+            self._conn.execute('DELETE FROM resume_cache')
+            self._commit()
+            self._total_bytes = 0
+
+    def close(self):
+        """Write anything pending and close the cache database"""
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    def _record_written(self, count: int):
+        """Count uncommitted records, committing once a full batch has built up"""
+        self._uncommitted += count
+        if self._uncommitted >= self.commit_every:
+            self._commit()
+
+    def _write_access_times(self):
+        if self._accessed:
+            self._conn.executemany('UPDATE resume_cache SET last_access = ? WHERE content_hash = ?',
+                                   [(accessed, content_hash) for content_hash, accessed in self._accessed.items()])
+            self._accessed.clear()
+
+    def _commit(self):
+        self._write_access_times()
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def _record_size(self, text: str, features_json: Optional[str]) -> int:
+        """Approximate the stored size of a record in bytes"""
+        return len(text.encode('utf-8')) + len(features_json or '')
+
+    def _discount(self, content_hash: str):
+        """Drop an existing record's size from the running total before it is replaced"""
+        row = self._conn.execute('SELECT size FROM resume_cache WHERE content_hash = ?',
+                                 (content_hash,)).fetchone()
+        if row:
+            self._total_bytes -= row[0]
+            self._conn.execute('DELETE FROM resume_cache WHERE content_hash = ?', (content_hash,))
+
+    def _evict(self):
+        """Delete least recently used records until the cache fits in max_bytes"""
+        if self._total_bytes > self.max_bytes:
+            # Recent reads must count before choosing what to evict
+            self._write_access_times()
+
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute('''
+            SELECT content_hash, size FROM resume_cache ORDER BY last_access LIMIT 100
+            ''').fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+
+            for content_hash, size in rows:
+                self._conn.execute('DELETE FROM resume_cache WHERE content_hash = ?', (content_hash,))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    break
@@ -0,0 +1,270 @@
+import json
+import os
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from typing import List, Dict, Tuple, Iterable
+from .similarity_scorer import top_n_indices
+from .text_processor import TextProcessor
+
+# Number of set bits in every byte value, for counting skill overlaps in packed bitsets
+POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+class ResumeMatrixStore:
+    """Append-only on-disk store of resume TF-IDF vectors and skill bitsets
+
+    Each append writes a new segment of raw .npy arrays: the CSR parts of the
+    TF-IDF matrix, a packed skill bitset per resume and the applicant IDs.
+    Segments are memory-mapped on open, so scoring a job description reads
+    only these arrays and never re-parses resume text. Rows are L2-normalized
+    by the vectorizer, so a dot product with the JD vector is the cosine.
+    """
+    def __init__(self, store_dir: str = "resume_store", vectorizer=None,
+                 model_dir: str = "models", text_processor: TextProcessor = None):
+        self.store_dir = store_dir
+        self.model_dir = model_dir
+        self.vectorizer = vectorizer
+        self._text_processor = text_processor
+        self.segments = []
+
+        os.makedirs(store_dir, exist_ok=True)
+        self.manifest = self._read_manifest()
+        self.deleted_ids = np.asarray(self.manifest.get('deleted', []), dtype=np.int64)
+        for segment in self.manifest['segments']:
+            self.segments.append(self._open_segment(segment['name']))
+
+    @property
+    def text_processor(self) -> TextProcessor:
+        """Text processor used for skill extraction, created on first use"""
+        if self._text_processor is None:
+            self._text_processor = TextProcessor()
+        return self._text_processor
+
+    def _get_vectorizer(self):
+        """Return the TF-IDF vectorizer, loading models/tfidf_vectorizer.pkl if none was given"""
+        if self.vectorizer is None:
+            vectorizer = joblib.load(os.path.join(self.model_dir, 'tfidf_vectorizer.pkl'))
+            # Models trained with --streaming save a HashingVectorizer under the same name
+            if not isinstance(vectorizer, TfidfVectorizer):
+                raise ValueError(f"{self.model_dir}/tfidf_vectorizer.pkl holds a {type(vectorizer).__name__} "
+                                 f"from streaming training, not a TF-IDF vectorizer; retrain without "
+                                 f"--streaming to build a resume store")
+            self.vectorizer = vectorizer
+        return self.vectorizer
+
+    def _skill_vocabulary(self) -> List[Tuple[str, str]]:
+        """Ordered (category, skill) pairs that define the bit positions"""
+        return [(category, skill)
+                for category, skills in self.text_processor.skill_patterns.items()
+                for skill in skills]
+
+    def _read_manifest(self) -> Dict:
+        """Load the store manifest, or start an empty one"""
+        manifest_path = os.path.join(self.store_dir, 'manifest.json')
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        return {'version': 1, 'dim': None, 'skills': None, 'next_segment': 0, 'segments': [],
+                'db_generation': None, 'deleted': []}
+
+    def _write_manifest(self):
+        """Replace the manifest atomically so readers never see a half-written one"""
+        manifest_path = os.path.join(self.store_dir, 'manifest.json')
+        tmp_path = manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.manifest, file)
+        os.replace(tmp_path, manifest_path)
+
+    def _segment_path(self, name: str, part: str) -> str:
+        return os.path.join(self.store_dir, f'{name}.{part}.npy')
+
+    def _new_segment_name(self) -> str:
+        """Reserve a segment name that has never been used in this store"""
+        name = f"segment_{self.manifest['next_segment']:05d}"
+        self.manifest['next_segment'] += 1
+        return name
+
+    def _write_segment(self, matrix: sparse.csr_matrix, skill_bits: np.ndarray,
+                       applicant_ids: np.ndarray) -> str:
+        """Save the arrays of a new segment and return its name"""
+        name = self._new_segment_name()
+        np.save(self._segment_path(name, 'data'), matrix.data.astype(np.float32))
+        np.save(self._segment_path(name, 'indices'), matrix.indices.astype(np.int32))
+        np.save(self._segment_path(name, 'indptr'), matrix.indptr.astype(np.int64))
+        np.save(self._segment_path(name, 'skills'), skill_bits)
+        np.save(self._segment_path(name, 'ids'), applicant_ids)
+        return name
+
+    def _open_segment(self, name: str) -> Dict:
+        """Memory-map the arrays of one segment"""
+        return {
+            part: np.load(self._segment_path(name, part), mmap_mode='r')
+            for part in ('data', 'indices', 'indptr', 'skills', 'ids')
+        }
+
+    def __len__(self) -> int:
+        return sum(len(segment['ids']) for segment in self.segments)
+
+    def stored_ids(self) -> np.ndarray:
+        """Applicant IDs in storage order"""
+        if not self.segments:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([segment['ids'] for segment in self.segments])
+
+    def encode_skills(self, skills_list: List[Dict[str, List[str]]]) -> np.ndarray:
+        """Pack skill dicts into one bitset row per resume"""
+        vocabulary = self._skill_vocabulary()
+        positions = {pair: i for i, pair in enumerate(vocabulary)}
+
+        bits = np.zeros((len(skills_list), len(vocabulary)), dtype=bool)
+        for row, skills in enumerate(skills_list):
+            for category, names in skills.items():
+                for name in names:
+                    position = positions.get((category, name))
+                    if position is not None:
+                        bits[row, position] = True
+        return np.packbits(bits, axis=1)
+
+    def append(self, applicant_ids: Iterable[int], texts: List[str],
+               skills: List[Dict[str, List[str]]] = None) -> int:
+        """Vectorize resumes and write them as a new segment; returns the number stored"""
+        applicant_ids = np.asarray(list(applicant_ids), dtype=np.int64)
+        if len(applicant_ids) == 0:
+            return 0
+
+        vectorizer = self._get_vectorizer()
+        cleaned = [' '.join(text.lower().split()) if isinstance(text, str) else '' for text in texts]
+        matrix = sparse.csr_matrix(vectorizer.transform(cleaned), dtype=np.float32)
+
+        if skills is None:
+            skills = [self.text_processor.extract_skills(text or '') for text in texts]
+        skill_bits = self.encode_skills(skills)
+
+        # The vocabulary and skill layout must not change under existing segments
+        vocabulary = [list(pair) for pair in self._skill_vocabulary()]
+        if self.manifest['dim'] is None:
+            self.manifest['dim'] = matrix.shape[1]
+            self.manifest['skills'] = vocabulary
+        elif self.manifest['dim'] != matrix.shape[1] or self.manifest['skills'] != vocabulary:
+            raise ValueError("Vectorizer or skill patterns differ from the ones this store was built with")
+
+        name = self._write_segment(matrix, skill_bits, applicant_ids)
+
+        self.manifest['segments'].append({'name': name, 'rows': len(applicant_ids)})
+        self._write_manifest()
+        self.segments.append(self._open_segment(name))
+        return len(applicant_ids)
+
+    def _remove_segment_files(self, names: List[str]):
+        for name in names:
+            for part in ('data', 'indices', 'indptr', 'skills', 'ids'):
+                os.remove(self._segment_path(name, part))
+
+    def clear(self):
+        """Drop every stored resume, keeping the segment counter so names are never reused"""
+        old_names = [segment['name'] for segment in self.manifest['segments']]
+        self.manifest.update({'dim': None, 'skills': None, 'segments': [], 'deleted': []})
+        self._write_manifest()
+
+        # Release the memory maps before removing their files
+        self.segments = []
+        self.deleted_ids = np.empty(0, dtype=np.int64)
+        self._remove_segment_files(old_names)
+
+    def sync_from_database(self, db_manager, batch_size: int = 5000) -> int:
+        """Bring the store up to date with the database
+
+        Applicants after the highest stored ID are appended and deleted ones are
+        recorded so score() skips them. Clearing the database restarts its IDs at
+        1, so stored IDs may now name other applicants; the store is then rebuilt
+        from scratch.
+        """
+        generation = db_manager.get_data_generation()
+        live_ids = np.asarray(db_manager.get_applicant_ids(), dtype=np.int64)
+        stored = self.stored_ids()
+        after_id = int(stored.max()) if len(stored) else 0
+
+        if len(stored) and (self.manifest.get('db_generation') or 0) != generation:
+            self.clear()
+            stored = self.stored_ids()
+            after_id = 0
+
+        self.manifest['db_generation'] = generation
+        self.deleted_ids = np.setdiff1d(stored, live_ids)
+        self.manifest['deleted'] = self.deleted_ids.tolist()
+        self._write_manifest()
+
+        added = 0
+        for batch in db_manager.iter_resume_batches(after_id, batch_size):
+            added += self.append([row[0] for row in batch], [row[1] for row in batch])
+        return added
+
+    def score(self, job_description: str, top_n: int = None, text_weight: float = 0.3,
+              skill_weight: float = 0.7) -> List[Tuple[int, float]]:
+        """Score every stored resume against a job description; returns (applicant_id, score) best first"""
+        if not self.segments:
+            return []
+
+        vectorizer = self._get_vectorizer()
+        dim = self.manifest['dim']
+        jd_vector = vectorizer.transform([' '.join(job_description.lower().split())])
+        jd_vector = np.asarray(jd_vector.todense(), dtype=np.float32).ravel()
+
+        jd_bits = self.encode_skills([self.text_processor.extract_skills(job_description)])[0]
+        jd_skill_count = int(POPCOUNT[jd_bits].sum())
+
+        scores = []
+        for segment in self.segments:
+            rows = len(segment['ids'])
+            matrix = sparse.csr_matrix((segment['data'], segment['indices'], segment['indptr']),
+                                       shape=(rows, dim), copy=False)
+            text_scores = matrix.dot(jd_vector)
+
+            if jd_skill_count:
+                skill_scores = POPCOUNT[segment['skills'] & jd_bits].sum(axis=1) / jd_skill_count
+            else:
+                skill_scores = np.zeros(rows, dtype=np.float32)
+
+            scores.append(np.minimum(1.0, text_weight * text_scores + skill_weight * skill_scores))
+
+        scores = np.concatenate(scores)
+        ids = self.stored_ids()
+
+        # Applicants deleted from the database since they were stored
+        if len(self.deleted_ids):
+            live = ~np.isin(ids, self.deleted_ids)
+            scores = scores[live]
+            ids = ids[live]
+
+        # Ties at the cut-off go to the earliest stored resumes, as in rank_candidates_tfidf
+        return [(int(ids[i]), float(scores[i])) for i in top_n_indices(scores, top_n)]
+
+    def compact(self):
+        """Merge all segments into one and drop deleted applicants, keeping the number of open files small"""
+        if len(self.segments) <= 1 and not len(self.deleted_ids):
+            return
+
+        dim = self.manifest['dim']
+        matrix = sparse.vstack([
+            sparse.csr_matrix((segment['data'], segment['indices'], segment['indptr']),
+                              shape=(len(segment['ids']), dim))
+            for segment in self.segments
+        ], format='csr')
+        skill_bits = np.concatenate([np.asarray(segment['skills']) for segment in self.segments])
+        ids = self.stored_ids()
+
+        live = ~np.isin(ids, self.deleted_ids)
+        matrix, skill_bits, ids = matrix[live], skill_bits[live], ids[live]
+
+        old_names = [segment['name'] for segment in self.manifest['segments']]
+        name = self._write_segment(matrix, skill_bits, ids)
+
+        self.manifest['segments'] = [{'name': name, 'rows': len(ids)}]
+        self.manifest['deleted'] = []
+        self._write_manifest()
+
+        # Release the old memory maps before removing their files
+        self.segments = [self._open_segment(name)]
+        self.deleted_ids = np.empty(0, dtype=np.int64)
+        self._remove_segment_files(old_names)
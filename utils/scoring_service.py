@@ -0,0 +1,273 @@
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Tuple, Callable
+from .model_trainer import ModelTrainer
+from .similarity_scorer import SimilarityScorer, JobProfile
+
+class MicroBatcher:
+    """Coalesce concurrent calls into batched calls made on one background thread
+
+    Each submit() waits for its own slice of the batch result. A batch is
+    closed when it holds max_batch items or max_wait seconds have passed since
+    its first request arrived.
+    """
+    def __init__(self, batch_function: Callable[[List], List], max_batch: int = 64,
+                 max_wait: float = 0.002):
+        self.batch_function = batch_function
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, items: List) -> List:
+        """Process items as part of the next batch and return their results"""
+        if not items:
+            return []
+        future = Future()
+        self._requests.put((items, future))
+        return future.result()
+
+    def close(self):
+        """Stop the batching thread"""
+        self._requests.put(None)
+
+    def _run(self):
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+
+            batch = [request]
+            count = len(request[0])
+            deadline = time.monotonic() + self.max_wait
+            while count < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._requests.put(None)
+                    break
+                batch.append(request)
+                count += len(request[0])
+
+            self._process(batch)
+
+    def _process(self, batch: List[Tuple[List, Future]]):
+        """Run one batched call and hand every caller its slice of the results"""
+        items = [item for request_items, _ in batch for item in request_items]
+        try:
+            results = self.batch_function(items)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        offset = 0
+        for request_items, future in batch:
+            future.set_result(results[offset:offset + len(request_items)])
+            offset += len(request_items)
+
+class ScoringService:
+    """Warm models and scorers shared by every request of the HTTP service"""
+    def __init__(self, model_dir: str = "models", max_batch: int = 64, max_wait: float = 0.002,
+                 profile_cache_size: int = 32):
+        self.scorer = SimilarityScorer()
+        self.scorer.text_processor.preload()
+
+        self.model_trainer = ModelTrainer()
+        self.models_loaded = (os.path.exists(model_dir) and
+                              self.model_trainer.load_models(model_dir))
+
+        self.classifier = MicroBatcher(self._classify_batch, max_batch, max_wait)
+
+        # Job descriptions are usually reused across many requests
+        self._profiles = OrderedDict()
+        self._profiles_lock = threading.Lock()
+        self.profile_cache_size = profile_cache_size
+
+    def close(self):
+        self.classifier.close()
+
+    def job_profile(self, job_description: str) -> JobProfile:
+        """Return the compiled JobProfile for a job description, building it at most once"""
+        with self._profiles_lock:
+            profile = self._profiles.get(job_description)
+            if profile is not None:
+                self._profiles.move_to_end(job_description)
+                return profile
+
+        profile = self.scorer.build_job_profile(job_description)
+        with self._profiles_lock:
+            self._profiles[job_description] = profile
+            if len(self._profiles) > self.profile_cache_size:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def _classify_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """Vectorize and classify a whole micro-batch in one call"""
+        return self.model_trainer.predict_categories(texts)
+
+    def classify(self, texts: List[str]) -> List[Dict]:
+        """Predict the job category of each text"""
+        return [
+            {'category': category, 'confidence': confidence}
+            for category, confidence in self.classifier.submit(texts)
+        ]
+
+    def score(self, job_description: str, resumes: List[Dict]) -> List[Dict]:
+        """Score resumes against a job description, in input order"""
+        job_profile = self.job_profile(job_description)
+        candidates = [
+            self.scorer.make_candidate(i, resumes[i], similarity, skill_gaps, features)
+            for i, similarity, skill_gaps, features in self.scorer.iter_scores(resumes, job_profile)
+        ]
+        self._classify_candidates(candidates, resumes)
+        return [self._candidate_json(candidate) for candidate in candidates]
+
+    def rank(self, job_description: str, resumes: List[Dict], top_n: int = None) -> List[Dict]:
+        """Rank resumes against a job description, best first"""
+        job_profile = self.job_profile(job_description)
+        ranked = self.scorer.rank_candidates(resumes, job_profile, top_n)
+        self._classify_candidates(ranked, resumes)
+        return [self._candidate_json(candidate) for candidate in ranked]
+
+    def _classify_candidates(self, candidates: List, resumes: List[Dict]):
+        """Predict categories through the shared micro-batcher when the models are loaded"""
+        if not self.models_loaded or not candidates:
+            return
+        predictions = self.classifier.submit([resumes[c.index]['text'] for c in candidates])
+        for candidate, (category, confidence) in zip(candidates, predictions):
+            candidate.category = category
+            candidate.category_confidence = confidence
+
+    def _candidate_json(self, candidate) -> Dict:
+        record = candidate.to_dict()
+        record['score'] = record.pop('similarity_score')
+        record['missing_skills'] = record.pop('skill_gaps')
+        if record['rank'] is None:
+            del record['rank']
+        return record
+
+class ServiceError(Exception):
+    """A request error reported to the client with an HTTP status"""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """JSON endpoints for /score, /rank, /classify and /health"""
+    service = None
+    access_log = False
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._read_body()
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok', 'models_loaded': bool(self.service.models_loaded)})
+        else:
+            self._send_json(404, {'error': f'Unknown endpoint {self.path}'})
+
+    def do_POST(self):
+        routes = {
+            '/score': self._handle_score,
+            '/rank': self._handle_rank,
+            '/classify': self._handle_classify,
+        }
+        # The body is always consumed first; on a kept-alive connection an unread
+        # body would otherwise be parsed as the next request
+        data = self._read_body()
+        handler = routes.get(self.path)
+        try:
+            if handler is None:
+                raise ServiceError(404, f'Unknown endpoint {self.path}')
+            self._send_json(200, {'results': handler(self._parse_json(data))})
+        except ServiceError as e:
+            self._send_json(e.status, {'error': str(e)})
+        except Exception as e:
+            self._send_json(500, {'error': f'{type(e).__name__}: {e}'})
+
+    def _handle_score(self, body: Dict) -> List[Dict]:
+        return self.service.score(self._job_description(body), self._resumes(body))
+
+    def _handle_rank(self, body: Dict) -> List[Dict]:
+        top_n = body.get('top_n')
+        if top_n is not None and (isinstance(top_n, bool) or not isinstance(top_n, int) or top_n < 1):
+            raise ServiceError(400, "'top_n' must be a positive integer")
+        return self.service.rank(self._job_description(body), self._resumes(body), top_n)
+
+    def _handle_classify(self, body: Dict) -> List[Dict]:
+        if not self.service.models_loaded:
+            raise ServiceError(503, 'Category models are not loaded')
+        texts = body.get('texts')
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise ServiceError(400, "'texts' must be a list of strings")
+        return self.service.classify(texts)
+
+    def _job_description(self, body: Dict) -> str:
+        job_description = body.get('job_description')
+        if not isinstance(job_description, str) or not job_description.strip():
+            raise ServiceError(400, "'job_description' must be a non-empty string")
+        return job_description
+
+    def _resumes(self, body: Dict) -> List[Dict]:
+        """Accept resumes as plain strings or as {"id": ..., "text": ...} objects"""
+        resumes = body.get('resumes')
+        if not isinstance(resumes, list):
+            raise ServiceError(400, "'resumes' must be a list")
+
+        normalized = []
+        for i, resume in enumerate(resumes):
+            if isinstance(resume, str):
+                resume = {'text': resume}
+            if not isinstance(resume, dict) or not isinstance(resume.get('text'), str):
+                raise ServiceError(400, f"Resume {i} must be a string or an object with a 'text' string")
+            normalized.append({'id': str(resume.get('id', i)), 'text': resume['text']})
+        return normalized
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length > 0 else b''
+
+    def _parse_json(self, data: bytes) -> Dict:
+        try:
+            body = json.loads(data or b'{}')
+        except ValueError as e:
+            raise ServiceError(400, f'Invalid JSON: {e}')
+        if not isinstance(body, dict):
+            raise ServiceError(400, 'Request body must be a JSON object')
+        return body
+
+    def _send_json(self, status: int, payload: Dict):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.access_log:
+            super().log_message(format, *args)
+
+class ScoringHTTPServer(ThreadingHTTPServer):
+    """One thread per connection, with a listen backlog sized for bursts of concurrent clients"""
+    daemon_threads = True
+    request_queue_size = 128
+
+def make_server(service: ScoringService, host: str = '127.0.0.1', port: int = 8765,
+                access_log: bool = False) -> ScoringHTTPServer:
+    """Create a threaded HTTP server bound to a warm ScoringService"""
+    handler = type('BoundScoringRequestHandler', (ScoringRequestHandler,),
+                   {'service': service, 'access_log': access_log})
+    return ScoringHTTPServer((host, port), handler)
@@ -1,20 +1,130 @@
+import hashlib
+import heapq
+import joblib
+import json
 import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Union, Iterable, Iterator
 from .text_processor import TextProcessor
 
+# Keywords kept per resume by resume_features
+RESUME_KEYWORD_COUNT = 50
+
+def top_n_indices(scores: np.ndarray, top_n: int = None) -> np.ndarray:
+    """Indices of the top_n best scores, best first, ties going to the lowest index
+    
+    Partial selection finds them without sorting every score; only the
+    selected indices are sorted. Without top_n every index is returned, sorted.
+    """
+    if top_n and top_n < len(scores):
+        cutoff = np.partition(scores, len(scores) - top_n)[len(scores) - top_n]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)[:top_n - len(above)]
+        best = np.concatenate([above, tied])
+    else:
+        best = np.arange(len(scores))
+    return best[np.lexsort((best, -scores[best]))]
+
+class JobProfile:
+    """Job description features compiled once and reused for every resume"""
+    def __init__(self, text: str, clean_text: str, keywords: set, skills: Dict[str, List[str]]):
+        self.text = text
+        self.clean_text = clean_text
+        self.keywords = keywords
+        self.skills = skills
+
+class Candidate:
+    """Ranked candidate record; the resume itself is referenced by its index in the input list"""
+    __slots__ = ('index', 'id', 'similarity_score', 'skill_gaps', 'missing_skills_count',
+                 'category', 'category_confidence', 'skills', 'rank')
+    
+    def __init__(self, index: int, id: str, similarity_score: float, skill_gaps: Dict[str, List[str]],
+                 category: str = 'Unknown', skills: Dict[str, List[str]] = None,
+                 category_confidence: float = None):
+        self.index = index
+        self.id = id
+        self.similarity_score = similarity_score
+        self.skill_gaps = skill_gaps
+        self.missing_skills_count = sum(len(skills) for skills in skill_gaps.values())
+        self.category = category
+        self.category_confidence = category_confidence
+        self.skills = skills or {}
+        self.rank = None
+    
+    def to_dict(self) -> Dict:
+        """Plain dict of the record, for export"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 class SimilarityScorer:
-    def __init__(self):
+    def __init__(self, scoring: str = 'keyword', vectorizer: TfidfVectorizer = None,
+                 text_weight: float = 0.3, skill_weight: float = 0.7):
         self.text_processor = TextProcessor()
         
-    def calculate_similarity(self, resume_text: str, job_description: str) -> float:
-        """Calculate similarity between resume and job description"""
-        resume_clean = self.text_processor.clean_text(resume_text)
+        # 'keyword' scores resumes one by one; 'tfidf' scores the whole batch with sparse algebra
+        self.scoring = scoring
+        self.vectorizer = vectorizer
+        self.text_weight = text_weight
+        self.skill_weight = skill_weight
+        self.features_version = self._features_version()
+    
+    def _features_version(self) -> str:
+        """Fingerprint of what resume_features extracts, so features cached by another version are not reused"""
+        vocabulary = json.dumps(self.text_processor.skill_patterns, sort_keys=True)
+        return hashlib.sha256(f"{vocabulary}|{RESUME_KEYWORD_COUNT}".encode('utf-8')).hexdigest()[:16]
+    
+    def load_vectorizer(self, model_dir: str = "models") -> bool:
+        """Use the trained TF-IDF vectorizer for tfidf scoring"""
+        try:
+            vectorizer = joblib.load(os.path.join(model_dir, 'tfidf_vectorizer.pkl'))
+        except Exception as e:
+            print(f"Error loading vectorizer: {e}")
+            return False
+        
+        # Models trained with --streaming save a HashingVectorizer, which has no IDF weights
+        if not isinstance(vectorizer, TfidfVectorizer):
+            print(f"Error loading vectorizer: {model_dir} holds a {type(vectorizer).__name__} from streaming "
+                  f"training, not a TF-IDF vectorizer; retrain without --streaming for tfidf scoring")
+            return False
+        self.vectorizer = vectorizer
+        return True
+    
+    def build_job_profile(self, job_description: str) -> JobProfile:
+        """Clean the job description and extract its keywords and skills once"""
         jd_clean = self.text_processor.clean_text(job_description)
+        return JobProfile(
+            text=job_description,
+            clean_text=jd_clean,
+            keywords=set(self.text_processor.extract_keywords(jd_clean, 50)),
+            skills=self.text_processor.extract_skills(job_description)
+        )
+    
+    def _as_job_profile(self, job_description: Union[str, JobProfile]) -> JobProfile:
+        """Accept either raw job description text or a prebuilt JobProfile"""
+        if isinstance(job_description, JobProfile):
+            return job_description
+        return self.build_job_profile(job_description)
         
-        # Extract keywords
-        resume_keywords = set(self.text_processor.extract_keywords(resume_clean, 50))
-        jd_keywords = set(self.text_processor.extract_keywords(jd_clean, 50))
+    def calculate_similarity(self, resume_text: str, job_description: Union[str, JobProfile]) -> float:
+        """Calculate similarity between resume and job description"""
+        job_profile = self._as_job_profile(job_description)
+        return self._score_features(self.resume_features(resume_text), job_profile)
+    
+    def resume_features(self, resume_text: str) -> Dict:
+        """Extract the job-independent features of a resume (skills and keyword counts)"""
+        resume_clean = self.text_processor.clean_text(resume_text)
+        return {
+            'skills': self.text_processor.extract_skills(resume_text),
+            'keyword_counts': self.text_processor.extract_keyword_counts(resume_clean, RESUME_KEYWORD_COUNT)
+        }
+    
+    def _score_features(self, features: Dict, job_profile: JobProfile) -> float:
+        """Score precomputed resume features against a JobProfile"""
+        resume_keywords = set(word for word, count in features['keyword_counts'])
+        jd_keywords = job_profile.keywords
         
         # Calculate Jaccard similarity for keywords
         if len(resume_keywords.union(jd_keywords)) > 0:
@@ -22,12 +132,8 @@ class SimilarityScorer:
         else:
             keyword_similarity = 0
         
-        # Extract skills
-        resume_skills = self.text_processor.extract_skills(resume_text)
-        jd_skills = self.text_processor.extract_skills(job_description)
-        
         # Calculate skill matching score
-        skill_score = self._calculate_skill_score(resume_skills, jd_skills)
+        skill_score = self._calculate_skill_score(features['skills'], job_profile.skills)
         
         # Combine scores (weighted average)
         total_similarity = (keyword_similarity * 0.3) + (skill_score * 0.7)
@@ -50,11 +156,14 @@ class SimilarityScorer:
         
         return matched_skills / total_jd_skills
     
-    def get_skill_gaps(self, resume_text: str, job_description: str) -> Dict[str, List[str]]:
+    def get_skill_gaps(self, resume_text: str, job_description: Union[str, JobProfile]) -> Dict[str, List[str]]:
         """Identify missing skills in resume compared to job description"""
+        job_profile = self._as_job_profile(job_description)
         resume_skills = self.text_processor.extract_skills(resume_text)
-        jd_skills = self.text_processor.extract_skills(job_description)
-        
+        return self._find_skill_gaps(resume_skills, job_profile.skills)
+    
+    def _find_skill_gaps(self, resume_skills: Dict, jd_skills: Dict) -> Dict[str, List[str]]:
+        """Compare already extracted resume skills with the job description skills"""
         skill_gaps = {}
         
         for category, skills in jd_skills.items():
@@ -68,33 +177,215 @@ class SimilarityScorer:
         
         return skill_gaps
     
-    def rank_candidates(self, resumes: List[Dict], job_description: str, 
-                       top_n: int = None) -> List[Dict]:
-        """Rank candidates based on similarity to job description"""
-        ranked = []
+    def _score_text(self, resume_text: str, job_profile: JobProfile, features: Dict = None,
+                    skill_gaps: bool = True) -> Tuple[float, Dict[str, List[str]], Dict]:
+        """Compute similarity and skill gaps for one resume, reusing cached features if given"""
+        if features is None:
+            features = self.resume_features(resume_text)
+        similarity = self._score_features(features, job_profile)
+        gaps = self._find_skill_gaps(features['skills'], job_profile.skills) if skill_gaps else None
+        return similarity, gaps, features
+    
+    def iter_scores(self, resumes: Iterable[Dict], job_description: Union[str, JobProfile],
+                    workers: int = None, chunk_size: int = 64,
+                    skill_gaps: bool = True) -> Iterator[Tuple[int, float, Dict, Dict]]:
+        """Yield (index, similarity, skill_gaps, features) for each resume as soon as it is scored
+        
+        With workers > 1 the resumes are split into chunks and scored in a process
+        pool, so results arrive in completion order rather than input order.
+        Resumes carrying a 'features' entry skip skill and keyword extraction.
+        With skill_gaps=False the gap analysis is skipped and None is yielded instead.
+        """
+        job_profile = self._as_job_profile(job_description)
         
-        for i, resume in enumerate(resumes):
-            similarity = self.calculate_similarity(resume['text'], job_description)
-            skill_gaps = self.get_skill_gaps(resume['text'], job_description)
+        if not workers or workers <= 1:
+            for i, resume in enumerate(resumes):
+                yield (i, *self._score_text(resume['text'], job_profile, resume.get('features'), skill_gaps))
+            return
+        
+        # Only send what scoring needs to the workers, never the full resume dicts
+        indexed_texts = ((i, resume['text'], resume.get('features')) for i, resume in enumerate(resumes))
+        chunks = iter(lambda: list(islice(indexed_texts, chunk_size)), [])
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(job_profile, skill_gaps)) as executor:
+            # Keep a bounded number of chunks in flight so large inputs stream through
+            pending = set()
+            for chunk in islice(chunks, workers * 2):
+                pending.add(executor.submit(_score_chunk, chunk))
             
-            ranked.append({
-                'index': i,
-                'id': resume.get('id', f'resume_{i}'),
-                'similarity_score': similarity,
-                'skill_gaps': skill_gaps,
-                'missing_skills_count': sum(len(skills) for skills in skill_gaps.values()),
-                'category': resume.get('category', 'Unknown'),
-                'original_data': resume
-            })
-        
-        # Sort by similarity score (descending)
-        ranked.sort(key=lambda x: x['similarity_score'], reverse=True)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for result in future.result():
+                        yield result
+                    for chunk in islice(chunks, 1):
+                        pending.add(executor.submit(_score_chunk, chunk))
+    
+    def make_candidate(self, index: int, resume: Dict, similarity: float,
+                       skill_gaps: Dict[str, List[str]], features: Dict = None) -> Candidate:
+        """Build the ranked-candidate record for one scored resume"""
+        return Candidate(
+            index=index,
+            id=resume.get('id', resume.get('name', f'resume_{index}')),
+            similarity_score=similarity,
+            skill_gaps=skill_gaps,
+            category=resume.get('category', 'Unknown'),
+            skills=features['skills'] if features else {}
+        )
+    
+    def assign_ranks(self, candidates: List[Candidate], top_n: int = None) -> List[Candidate]:
+        """Sort candidates by score and number them, keeping input order for ties"""
+        candidates.sort(key=lambda x: (-x.similarity_score, x.index))
         
         # Add rank position
-        for i, candidate in enumerate(ranked):
-            candidate['rank'] = i + 1
+        for i, candidate in enumerate(candidates):
+            candidate.rank = i + 1
         
         if top_n:
-            return ranked[:top_n]
+            return candidates[:top_n]
+        
+        return candidates
+    
+    def select_top(self, scored: Iterable[Tuple[int, float, Dict, Dict]], top_n: int) -> List[Tuple[int, float, Dict]]:
+        """Keep the top_n (index, similarity, features) results in a bounded min-heap
+        
+        Ties are broken by input order, as in assign_ranks, so the finalists are
+        exactly the first top_n of a full sort.
+        """
+        heap = []
+        for i, similarity, _, features in scored:
+            entry = (similarity, -i, features)
+            if len(heap) < top_n:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+        return [(-neg_index, similarity, features) for similarity, neg_index, features in heap]
+    
+    def make_finalists(self, selected: Iterable[Tuple[int, float, Dict]], resumes,
+                       job_profile: JobProfile) -> List[Candidate]:
+        """Run the skill gap analysis for select_top results and rank them"""
+        finalists = [
+            self.make_candidate(i, resumes[i], similarity,
+                                self._find_skill_gaps(features['skills'], job_profile.skills), features)
+            for i, similarity, features in selected
+        ]
+        return self.assign_ranks(finalists)
+    
+    def classify_candidates(self, candidates: List[Candidate], resumes, classifier,
+                            batch_size: int = 500) -> List[Candidate]:
+        """Fill in each candidate's category and confidence with batched classifier calls"""
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            predictions = classifier.predict_categories([resumes[c.index]['text'] for c in batch])
+            for candidate, (category, confidence) in zip(batch, predictions):
+                candidate.category = category
+                candidate.category_confidence = confidence
+        return candidates
+    
+    def rank_candidates(self, resumes: List[Dict], job_description: Union[str, JobProfile], 
+                       top_n: int = None, workers: int = None, classifier=None) -> List[Candidate]:
+        """Rank candidates based on similarity to job description
+        
+        With top_n only the finalists get a skill gap analysis and a candidate record.
+        A trained ModelTrainer passed as classifier predicts the returned candidates' categories.
+        """
+        if self.scoring == 'tfidf':
+            ranked = self.rank_candidates_tfidf(resumes, job_description, top_n)
+        elif top_n:
+            job_profile = self._as_job_profile(job_description)
+            scored = self.iter_scores(resumes, job_profile, workers, skill_gaps=False)
+            ranked = self.make_finalists(self.select_top(scored, top_n), resumes, job_profile)
+        else:
+            ranked = self.assign_ranks([
+                self.make_candidate(i, resumes[i], similarity, skill_gaps, features)
+                for i, similarity, skill_gaps, features in self.iter_scores(resumes, job_description, workers)
+            ])
+        
+        if classifier is not None:
+            self.classify_candidates(ranked, resumes, classifier)
+        return ranked
+    
+    def score_batch_tfidf(self, resume_texts: List[str], job_description: Union[str, JobProfile],
+                          resume_skills: List[Dict] = None) -> np.ndarray:
+        """Blend TF-IDF cosine similarity and skill overlap for a whole batch at once"""
+        if not resume_texts:
+            return np.zeros(0)
+        
+        job_profile = self._as_job_profile(job_description)
+        
+        # Same light cleaning the vectorizer was trained with
+        texts = [' '.join(text.lower().split()) if isinstance(text, str) else '' for text in resume_texts]
+        jd_text = ' '.join(job_profile.text.lower().split())
+        
+        vectorizer = self.vectorizer
+        if vectorizer is None or not hasattr(vectorizer, 'idf_'):
+            # No trained model: fit on this batch plus the job description
+            vectorizer = TfidfVectorizer(ngram_range=(1, 2), stop_words='english', sublinear_tf=True)
+            try:
+                vectorizer.fit(texts + [jd_text])
+            except ValueError:
+                # Every text is empty or stopwords only, so there is nothing to compare
+                vectorizer = None
         
-        return ranked
\ No newline at end of file
+        if vectorizer is None:
+            text_scores = np.zeros(len(texts))
+        else:
+            # One sparse matrix for all resumes, one sparse product against the JD vector
+            resume_matrix = vectorizer.transform(texts)
+            jd_vector = vectorizer.transform([jd_text])
+            text_scores = cosine_similarity(resume_matrix, jd_vector).ravel()
+        
+        if resume_skills is None:
+            resume_skills = [self.text_processor.extract_skills(text) for text in resume_texts]
+        skill_scores = np.fromiter(
+            (self._calculate_skill_score(skills, job_profile.skills) for skills in resume_skills),
+            dtype=float, count=len(resume_skills)
+        )
+        
+        return np.minimum(1.0, self.text_weight * text_scores + self.skill_weight * skill_scores)
+    
+    def rank_candidates_tfidf(self, resumes: List[Dict], job_description: Union[str, JobProfile],
+                              top_n: int = None) -> List[Candidate]:
+        """Rank candidates with the vectorized TF-IDF scoring engine"""
+        job_profile = self._as_job_profile(job_description)
+        
+        resume_skills = [
+            resume['features']['skills'] if resume.get('features') else self.text_processor.extract_skills(resume['text'])
+            for resume in resumes
+        ]
+        scores = self.score_batch_tfidf([resume['text'] for resume in resumes], job_profile, resume_skills)
+        
+        # Ties at the cut-off go to the earliest resumes, as in assign_ranks
+        ranked = []
+        for i in top_n_indices(scores, top_n).tolist():
+            resume = resumes[i]
+            skill_gaps = self._find_skill_gaps(resume_skills[i], job_profile.skills)
+            features = resume.get('features') or {'skills': resume_skills[i]}
+            ranked.append(self.make_candidate(i, resume, float(scores[i]), skill_gaps, features))
+        
+        return self.assign_ranks(ranked, top_n)
+    
+    def rank_candidates_parallel(self, resumes: List[Dict], job_description: Union[str, JobProfile],
+                                 top_n: int = None, workers: int = None, classifier=None) -> List[Candidate]:
+        """Rank candidates using one worker process per CPU core by default"""
+        return self.rank_candidates(resumes, job_description, top_n, workers or os.cpu_count() or 1, classifier)
+
+
+# Per-process state for parallel screening, set up once by the pool initializer
+_worker_scorer = None
+_worker_profile = None
+_worker_skill_gaps = True
+
+def _init_worker(job_profile: JobProfile, skill_gaps: bool = True):
+    """Build a scorer and keep the job profile in each worker process"""
+    global _worker_scorer, _worker_profile, _worker_skill_gaps
+    _worker_scorer = SimilarityScorer()
+    _worker_scorer.text_processor.preload()
+    _worker_profile = job_profile
+    _worker_skill_gaps = skill_gaps
+
+def _score_chunk(chunk: List[Tuple[int, str, Dict]]) -> List[Tuple[int, float, Dict, Dict]]:
+    """Score a chunk of (index, text, features) tuples inside a worker process"""
+    return [(i, *_worker_scorer._score_text(text, _worker_profile, features, _worker_skill_gaps))
+            for i, text, features in chunk]
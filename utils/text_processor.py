@@ -1,21 +1,156 @@
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
-from typing import List, Set, Dict
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import List, Set, Dict, Tuple
 import string
 
-# Download NLTK data
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
-nltk.download('wordnet', quiet=True)
+# NLTK data packages and where nltk.data.find looks for them locally
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+}
+
+# Text already reduced by clean_text: lowercase ASCII letters and single spaces
+CLEAN_TEXT_RE = re.compile(r'[a-z ]*')
+
+# URLs and email addresses are dropped before character filtering. A \S+@\S+
+# match always spans a whole whitespace-delimited token, so anchoring it at
+# token starts gives the same matches without retrying inside every word.
+URL_RE = re.compile(r'http\S+|www\S+|https\S+')
+EMAIL_RE = re.compile(r'(?<!\S)\S+@\S+')
+
+# Everything but ASCII letters becomes a space: a translate table for ASCII
+# text, where str.translate has a fast path, and a regex for everything else
+LETTER_TABLE = {codepoint: codepoint if chr(codepoint) in string.ascii_letters else ord(' ')
+                for codepoint in range(128)}
+NON_LETTER_RE = re.compile(r'[^a-zA-Z]+')
+
+# Words word_tokenize splits even without punctuation (Treebank CONTRACTIONS2)
+SPLIT_CONTRACTIONS = {
+    'cannot': ('can', 'not'),
+    'gimme': ('gim', 'me'),
+    'gonna': ('gon', 'na'),
+    'gotta': ('got', 'ta'),
+    'lemme': ('lem', 'me'),
+    'wanna': ('wan', 'na'),
+}
+
+# Local lookup results, found or not, so a missing package is only searched for once
+_resource_status = {}
+_lemmatizer = None
+_word_tokenize = None
+_stop_words = None
+
+# NLTK's lazy corpus loaders are not thread-safe; the first load of each one happens under this lock
+_nltk_lock = threading.RLock()
+
+def ensure_nltk_resource(name: str, download: bool = False) -> bool:
+    """Check that an NLTK data package is installed locally, downloading it only when asked to"""
+    status = _resource_status.get(name)
+    if status is not None and (status or not download):
+        return status
+    
+    with _nltk_lock:
+        import nltk
+        try:
+            nltk.data.find(NLTK_RESOURCES[name])
+            found = True
+        except LookupError:
+            found = False
+            if download and nltk.download(name, quiet=True):
+                found = True
+        
+        if not found and name not in _resource_status:
+            print(f"Warning: NLTK resource '{name}' is not installed. Run: python setup.py")
+        _resource_status[name] = found
+        return found
+
+def require_nltk_resource(name: str):
+    """Raise a LookupError pointing at setup.py when an NLTK data package is missing"""
+    if not ensure_nltk_resource(name):
+        raise LookupError(f"NLTK resource '{name}' is not installed. Run: python setup.py")
+
+def get_lemmatizer():
+    """Return the shared WordNet lemmatizer, creating it and loading WordNet on first use"""
+    global _lemmatizer
+    if _lemmatizer is None:
+        with _nltk_lock:
+            if _lemmatizer is None:
+                require_nltk_resource('wordnet')
+                from nltk.stem import WordNetLemmatizer
+                lemmatizer = WordNetLemmatizer()
+                # WordNet itself is only read on the first lemmatization
+                lemmatizer.lemmatize('resources')
+                _lemmatizer = lemmatizer
+    return _lemmatizer
+
+def get_stop_words() -> Set[str]:
+    """Return the English stopword set, loading it on first use"""
+    global _stop_words
+    if _stop_words is None:
+        with _nltk_lock:
+            if _stop_words is None:
+                require_nltk_resource('stopwords')
+                from nltk.corpus import stopwords
+                _stop_words = set(stopwords.words('english'))
+    return _stop_words
+
+@lru_cache(maxsize=100000)
+def lemmatize(token: str) -> str:
+    """Lemmatize a token, memoized across resumes and TextProcessor instances"""
+    return get_lemmatizer().lemmatize(token)
+
+def word_tokenize(text: str) -> List[str]:
+    """NLTK word_tokenize, loading punkt on first use"""
+    global _word_tokenize
+    if _word_tokenize is None:
+        with _nltk_lock:
+            if _word_tokenize is None:
+                require_nltk_resource('punkt')
+                from nltk.tokenize import word_tokenize as nltk_word_tokenize
+                # Loads the punkt model now, inside the lock
+                nltk_word_tokenize('resources')
+                _word_tokenize = nltk_word_tokenize
+    return _word_tokenize(text)
+
+def preload_nltk(download: bool = False):
+    """Load every NLTK resource up front instead of on first use, for long-running workers
+    
+    Missing packages are downloaded only with download=True.
+    """
+    available = {name: ensure_nltk_resource(name, download) for name in NLTK_RESOURCES}
+    
+    # Punkt is only needed for text clean_text has not already reduced to plain
+    # words, so a missing punkt fails later on that slow path instead of here
+    if available['punkt']:
+        word_tokenize('resources')
+    get_stop_words()
+    get_lemmatizer()
 
 class TextProcessor:
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
-        self.lemmatizer = WordNetLemmatizer()
+    def __init__(self, preload: bool = False):
         self.skill_patterns = self._load_skill_patterns()
+        self._skill_regex, self._skill_prefixes = self._compile_skill_matcher()
+        
+        # NLTK data is otherwise loaded the first time tokenization needs it
+        if preload:
+            self.preload()
+    
+    @property
+    def stop_words(self) -> Set[str]:
+        """English stopwords, loaded on first use"""
+        return get_stop_words()
+    
+    @property
+    def lemmatizer(self):
+        """Shared WordNet lemmatizer, created on first use"""
+        return get_lemmatizer()
+    
+    def preload(self, download: bool = False):
+        """Load stopwords, punkt and WordNet now rather than during the first screening"""
+        preload_nltk(download)
         
     def _load_skill_patterns(self) -> Dict[str, List[str]]:
         """Load skill patterns and keywords for extraction"""
@@ -32,6 +167,25 @@ class TextProcessor:
         }
         return skill_dict
     
+    def _compile_skill_matcher(self):
+        """Compile all skills into one regex so extraction is a single scan"""
+        # Matching runs on text with spaces removed, which covers both the exact
+        # and the no-space variant. The lookahead yields the longest skill at
+        # each position; shorter skills starting there are its prefixes.
+        compact_skills = set()
+        for skill_list in self.skill_patterns.values():
+            for skill in skill_list:
+                compact_skills.add(skill.replace(' ', ''))
+        
+        ordered = sorted(compact_skills, key=lambda s: (-len(s), s))
+        skill_regex = re.compile('(?=(' + '|'.join(re.escape(s) for s in ordered) + '))')
+        
+        skill_prefixes = {
+            skill: frozenset(other for other in compact_skills if skill.startswith(other))
+            for skill in compact_skills
+        }
+        return skill_regex, skill_prefixes
+    
     def clean_text(self, text: str) -> str:
         """Clean and preprocess text"""
         if not isinstance(text, str):
@@ -40,64 +194,78 @@ class TextProcessor:
         # Convert to lowercase
         text = text.lower()
         
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-        
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Remove special characters and numbers
-        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+        # Remove URLs and email addresses, skipping the scan when they cannot occur
+        if 'http' in text or 'www' in text:
+            text = URL_RE.sub('', text)
+        if '@' in text:
+            text = EMAIL_RE.sub('', text)
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        # Replace special characters, numbers and whitespace with single spaces
+        if text.isascii():
+            return ' '.join(text.translate(LETTER_TABLE).split())
+        return NON_LETTER_RE.sub(' ', text).strip()
     
     def tokenize_text(self, text: str) -> List[str]:
         """Tokenize and lemmatize text"""
-        tokens = word_tokenize(text)
+        if CLEAN_TEXT_RE.fullmatch(text):
+            tokens = self._split_clean_text(text)
+        else:
+            tokens = word_tokenize(text)
         
         # Remove stopwords and lemmatize
         processed_tokens = []
         for token in tokens:
             if token not in self.stop_words and len(token) > 2:
-                lemma = self.lemmatizer.lemmatize(token)
-                processed_tokens.append(lemma)
+                processed_tokens.append(lemmatize(token))
         
         return processed_tokens
     
+    def _split_clean_text(self, text: str) -> List[str]:
+        """Tokenize output of clean_text the same way word_tokenize does, without its regex passes"""
+        tokens = text.split()
+        if SPLIT_CONTRACTIONS.keys().isdisjoint(tokens):
+            return tokens
+        
+        split_tokens = []
+        for token in tokens:
+            if token in SPLIT_CONTRACTIONS:
+                split_tokens.extend(SPLIT_CONTRACTIONS[token])
+            else:
+                split_tokens.append(token)
+        return split_tokens
+    
     def extract_skills(self, text: str) -> Dict[str, List[str]]:
         """Extract skills from text"""
-        skills_found = {category: [] for category in self.skill_patterns.keys()}
-        text_lower = text.lower()
+        compact_text = text.lower().replace(' ', '')
         
-        for category, skill_list in self.skill_patterns.items():
-            for skill in skill_list:
-                # Check for exact skill matches
-                if skill in text_lower:
-                    skills_found[category].append(skill)
-                # Check for variations
-                elif skill.replace(' ', '') in text_lower.replace(' ', ''):
-                    skills_found[category].append(skill)
+        # Single scan for every skill occurrence
+        matched = set()
+        for longest in set(self._skill_regex.findall(compact_text)):
+            matched |= self._skill_prefixes[longest]
         
-        # Remove empty categories
-        skills_found = {k: v for k, v in skills_found.items() if v}
+        skills_found = {}
+        for category, skill_list in self.skill_patterns.items():
+            found = [skill for skill in skill_list if skill.replace(' ', '') in matched]
+            if found:
+                skills_found[category] = found
         
         return skills_found
     
     def extract_keywords(self, text: str, top_n: int = 20) -> List[str]:
         """Extract important keywords using TF-IDF like approach"""
+        return [word for word, freq in self.extract_keyword_counts(text, top_n)]
+    
+    def extract_keyword_counts(self, text: str, top_n: int = 20) -> List[Tuple[str, int]]:
+        """Extract the most frequent keywords together with their counts"""
         tokens = self.tokenize_text(text)
         
         # Calculate frequency
-        freq_dist = nltk.FreqDist(tokens)
+        freq_dist = Counter(tokens)
         
         # Get most common words
-        keywords = [word for word, freq in freq_dist.most_common(top_n)]
-        
-        return keywords
+        return freq_dist.most_common(top_n)
     
     def preprocess_batch(self, texts: List[str]) -> List[str]:
         """Preprocess a batch of texts"""
-        return [self.clean_text(text) for text in texts]
\ No newline at end of file
+        clean_text = self.clean_text
+        return [clean_text(text) for text in texts]
\ No newline at end of file